@@ -3,11 +3,20 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 import csv
+from functools import lru_cache
 from pathlib import Path
+import re
+import sys
 from typing import Any, Optional
+import unicodedata
 
 import yaml
 
+try:  # LibYAML acelera el análisis cuando PyYAML se compiló con ella.
+    from yaml import CSafeLoader as SafeYamlLoader
+except ImportError:  # pragma: no cover - PyYAML sin LibYAML
+    from yaml import SafeLoader as SafeYamlLoader  # type: ignore[assignment]
+
 
 class ConfigError(RuntimeError):
     """Error al cargar o interpretar la configuración."""
@@ -16,11 +25,19 @@ class ConfigError(RuntimeError):
 class ConfigManager:
     """Encargado de cargar la configuración y exponer utilidades de normalización."""
 
+    # ``_`` forma parte de la clase, así que cada racha se colapsa en una sola pasada.
+    _NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
     def __init__(self, base_dir: Optional[Path] = None, config_path: Optional[Path] = None):
         self.base_dir = Path(base_dir or Path.cwd())
         self.config_path = config_path or (self.base_dir / "config" / "config.yaml")
         self._config: dict[str, Any] = {}
         self._aliases: dict[str, dict[str, str]] = {}
+        # ``normalize`` se invoca varias veces por fila de CSV con un conjunto
+        # reducido de valores; la caché se limpia en cada ``reload``.
+        self._normalize_cached = lru_cache(maxsize=4096)(self._normalize_uncached)
+        # Directorios ya creados; ``data_path`` se consulta en cada tarea.
+        self._known_dirs: set[Path] = set()
         self.reload()
 
     # ------------------------------------------------------------------
@@ -29,11 +46,11 @@ class ConfigManager:
     def reload(self) -> None:
         data = self._default_config()
         if self.config_path.exists():
-            with self.config_path.open("r", encoding="utf-8") as handle:
-                user_config = yaml.safe_load(handle) or {}
-            data = self._deep_merge_dicts(data, user_config)
+            data = self._deep_merge_dicts(data, self._load_user_config())
         self._config = data
         self._aliases = self._build_aliases()
+        self._normalize_cached.cache_clear()
+        self._known_dirs.clear()
 
     @property
     def raw(self) -> dict[str, Any]:
@@ -45,29 +62,35 @@ class ConfigManager:
     def resolve_path(self, *parts: str, create: bool = False) -> Path:
         path = self.base_dir.joinpath(*parts)
         if create:
-            path.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(path)
         return path
 
     def data_path(self) -> Path:
-        path = self.resolve_path(self._config["data"]["base_path"])
-        path.mkdir(parents=True, exist_ok=True)
-        return path
+        return self.resolve_path(self._config["data"]["base_path"], create=True)
 
     def urls_path(self) -> Path:
         configured = self.resolve_path(self._config["data"]["urls_path"])
         legacy = self.base_dir / "Urls"
         if not configured.exists() and legacy.exists():
             return legacy
-        configured.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(configured)
         return configured
 
     def logs_path(self) -> Path:
         return self.resolve_path(self._config["data"].get("logs_path", "logs"), create=True)
 
+    def _ensure_dir(self, path: Path) -> None:
+        if path not in self._known_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(path)
+
     # ------------------------------------------------------------------
     # Alias y normalización
     # ------------------------------------------------------------------
     def normalize(self, dimension: str, value: Optional[str]) -> tuple[str, str]:
+        return self._normalize_cached(dimension, value)
+
+    def _normalize_uncached(self, dimension: str, value: Optional[str]) -> tuple[str, str]:
         value = (value or "").strip()
         if not value:
             return ("Unknown", "")
@@ -109,6 +132,17 @@ class ConfigManager:
             return detail_name
         return f"{website_code.lower()}_det"
 
+    def scraper_settings(self) -> dict[str, Any]:
+        return self._config.get("scrapers", {})
+
+    def python_executable(self) -> str:
+        # Sin valor explícito los scrapers usan el mismo intérprete (y entorno
+        # virtual) que el orquestador, no el ``python3`` que haya en el PATH.
+        return str(self.scraper_settings().get("python_executable") or sys.executable)
+
+    def scraper_timeout_seconds(self) -> float:
+        return float(self.scraper_settings().get("timeout_minutes", 45)) * 60
+
     def execution_settings(self) -> dict[str, Any]:
         return self._config.get("execution", {})
 
@@ -132,7 +166,6 @@ class ConfigManager:
             },
             "scrapers": {
                 "path": "Scrapers",
-                "python_executable": "python3",
                 "timeout_minutes": 45,
                 "memory_limit_mb": 1024,
             },
@@ -166,6 +199,10 @@ class ConfigManager:
             },
         }
 
+    def _load_user_config(self) -> dict[str, Any]:
+        text = self.config_path.read_text(encoding="utf-8")
+        return yaml.load(text, Loader=SafeYamlLoader) or {}
+
     def _deep_merge_dicts(self, base: dict[str, Any], extra: Mapping[str, Any]) -> dict[str, Any]:
         result = dict(base)
         for key, value in extra.items():
@@ -176,14 +213,10 @@ class ConfigManager:
         return result
 
     def _standardize_key(self, value: str) -> str:
-        import re
-        import unicodedata
-
         normalized = unicodedata.normalize("NFKD", value)
         normalized = "".join(ch for ch in normalized if not unicodedata.combining(ch))
         normalized = normalized.lower()
-        normalized = re.sub(r"[^a-z0-9]+", "_", normalized)
-        normalized = re.sub(r"_+", "_", normalized)
+        normalized = self._NON_ALNUM_RE.sub("_", normalized)
         return normalized.strip("_")
 
     def _build_aliases(self) -> dict[str, dict[str, str]]:
@@ -1,7 +1,9 @@
 """Módulo de persistencia y utilidades de acceso a SQLite."""
 from __future__ import annotations
 
+import json
 import sqlite3
+import threading
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
@@ -27,10 +29,19 @@ def _row_to_batch(row: sqlite3.Row) -> ExecutionBatch:
 class TaskRepository:
     """Gestor de base de datos para tareas de scraping."""
 
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path, *, read_only: bool = False):
         self.db_path = Path(db_path)
         if not self.db_path.is_absolute():
             self.db_path = self.db_path.resolve()
+        self.read_only = read_only
+        # Una conexión por hilo, abierta la primera vez que ese hilo la pide y
+        # reutilizada después: los pragmas se aplican una sola vez por conexión.
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        if read_only:
+            # Sólo consultas (monitor): la base ya existe y no se toca el esquema.
+            return
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._ensure_schema()
 
@@ -39,21 +50,65 @@ class TaskRepository:
     # ------------------------------------------------------------------
     @contextmanager
     def get_connection(self) -> Iterator[sqlite3.Connection]:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA synchronous=NORMAL")
-        conn.execute("PRAGMA busy_timeout=30000")
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect_read_only() if self.read_only else self._connect()
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        # La conexión sobrevive al bloque: nunca debe quedar una transacción
+        # abierta que retenga el bloqueo de escritura del WAL.
         try:
             yield conn
-        finally:
+        except BaseException:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+        else:
+            if conn.in_transaction:
+                conn.commit()
+
+    def close(self) -> None:
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
             conn.close()
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        # ``journal_mode=WAL`` queda guardado en el archivo; se fija una vez en
+        # ``_ensure_schema``. ``check_same_thread`` se relaja sólo para que
+        # ``close`` pueda cerrar las conexiones de otros hilos.
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=30000")
+        # El WAL crece en ráfagas (alta del lote, cierre de tareas); se vacía
+        # con ``checkpoint`` entre fases en lugar de cada 1000 páginas.
+        conn.execute("PRAGMA wal_autocheckpoint=10000")
+        return conn
+
+    def checkpoint(self) -> None:
+        """Vuelca el WAL a la base y lo trunca; se llama al cerrar cada fase del lote."""
+
+        with self.get_connection() as conn:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def _connect_read_only(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(f"{self.db_path.as_uri()}?mode=ro", uri=True, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA query_only=1")
+        conn.execute("PRAGMA busy_timeout=30000")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
 
     # ------------------------------------------------------------------
     # Schema
     # ------------------------------------------------------------------
     def _ensure_schema(self) -> None:
         with self.get_connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS execution_batches (
@@ -124,6 +179,20 @@ class TaskRepository:
                 ON scraping_tasks(batch_id, task_key)
                 """
             )
+            # Listados por scraper (``monitor_cli tasks``, ``next_task_for_site``)
+            # se recorren en orden sin ordenar en memoria.
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_tasks_batch_scraper_order
+                ON scraping_tasks(batch_id, scraper_name, order_num)
+                """
+            )
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_batches_started
+                ON execution_batches(started_at)
+                """
+            )
             conn.commit()
 
     def _ensure_column(self, conn: sqlite3.Connection, table: str, column: str, ddl: str) -> None:
@@ -153,6 +222,33 @@ class TaskRepository:
             row = conn.execute("SELECT * FROM execution_batches WHERE batch_id = ?", (batch_id,)).fetchone()
         return _row_to_batch(row) if row else None
 
+    def latest_batch_summary(self) -> Optional[tuple[ExecutionBatch, list[tuple[str, int]]]]:
+        """Lote abierto más reciente (o el último registrado) con sus tareas por estado.
+
+        Resuelve en una sola consulta lo que antes eran hasta cuatro: buscar el
+        lote abierto, caer al último, releerlo y agrupar sus tareas.
+        """
+
+        with self.get_connection() as conn:
+            rows = conn.execute(
+                """
+                WITH target AS (
+                    SELECT * FROM execution_batches
+                    ORDER BY status IN ('running', 'created') DESC, started_at DESC
+                    LIMIT 1
+                )
+                SELECT target.*, t.status AS task_status, COUNT(t.id) AS task_total
+                FROM target
+                LEFT JOIN scraping_tasks AS t ON t.batch_id = target.batch_id
+                GROUP BY t.status
+                ORDER BY t.status
+                """
+            ).fetchall()
+        if not rows:
+            return None
+        counts = [(row["task_status"], row["task_total"]) for row in rows if row["task_status"] is not None]
+        return _row_to_batch(rows[0]), counts
+
     def next_execution_number(self, month_year: str, desired: int) -> int:
         with self.get_connection() as conn:
             rows = conn.execute("SELECT execution_number FROM execution_batches WHERE month_year = ?", (month_year,)).fetchall()
@@ -187,17 +283,22 @@ class TaskRepository:
 
     def update_batch_progress(self, batch_id: str, completed_delta: int = 0, failed_delta: int = 0) -> None:
         with self.get_connection() as conn:
-            conn.execute(
-                """
-                UPDATE execution_batches
-                SET completed_tasks = COALESCE(completed_tasks, 0) + ?,
-                    failed_tasks = COALESCE(failed_tasks, 0) + ?
-                WHERE batch_id = ?
-                """,
-                (completed_delta, failed_delta, batch_id),
-            )
+            self._add_batch_progress(conn, batch_id, completed_delta, failed_delta)
             conn.commit()
 
+    def _add_batch_progress(
+        self, conn: sqlite3.Connection, batch_id: str, completed_delta: int, failed_delta: int
+    ) -> None:
+        conn.execute(
+            """
+            UPDATE execution_batches
+            SET completed_tasks = COALESCE(completed_tasks, 0) + ?,
+                failed_tasks = COALESCE(failed_tasks, 0) + ?
+            WHERE batch_id = ?
+            """,
+            (completed_delta, failed_delta, batch_id),
+        )
+
     def mark_batch_completed(self, batch_id: str) -> None:
         with self.get_connection() as conn:
             conn.execute(
@@ -216,38 +317,43 @@ class TaskRepository:
     def insert_tasks(self, batch_id: str, tasks: Sequence[ScrapingTask]) -> None:
         if not tasks:
             return
+        rows = [
+            (
+                batch_id,
+                batch_id,
+                task.scraper_name,
+                task.website,
+                task.city,
+                task.operation,
+                task.product,
+                task.website_code,
+                task.city_code,
+                task.operation_code,
+                task.product_code,
+                task.url,
+                task.order,
+                task.status.value,
+                task.attempts,
+                task.max_attempts,
+                1 if task.is_detail else 0,
+                task.depends_on,
+                task.task_key(),
+            )
+            for task in tasks
+        ]
         with self.get_connection() as conn:
-            for task in tasks:
-                conn.execute(
-                    """
-                    INSERT OR IGNORE INTO scraping_tasks (
-                        batch_id, execution_batch, scraper_name, website, city, operation,
-                        product, website_code, city_code, operation_code, product_code, url, order_num, status, attempts, max_attempts,
-                        created_at, is_detail, depends_on, task_key
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, ?, ?, ?)
-                    """,
-                    (
-                        batch_id,
-                        batch_id,
-                        task.scraper_name,
-                        task.website,
-                        task.city,
-                        task.operation,
-                        task.product,
-                        task.website_code,
-                        task.city_code,
-                        task.operation_code,
-                        task.product_code,
-                        task.url,
-                        task.order,
-                        task.status.value,
-                        task.attempts,
-                        task.max_attempts,
-                        1 if task.is_detail else 0,
-                        task.depends_on,
-                        task.task_key(),
-                    ),
-                )
+            # Una sola sentencia preparada y una sola transacción para todo el lote.
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO scraping_tasks (
+                    batch_id, execution_batch, scraper_name, website, city, operation,
+                    product, website_code, city_code, operation_code, product_code, url, order_num, status, attempts, max_attempts,
+                    created_at, is_detail, depends_on, task_key
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, ?, ?, ?)
+                """,
+                rows,
+            )
             conn.commit()
 
     def reset_running_tasks(self, batch_id: str) -> None:
@@ -263,24 +369,29 @@ class TaskRepository:
             conn.commit()
 
     def tasks_by_status(self, batch_id: str, statuses: Sequence[TaskStatus]) -> list[ScrapingTask]:
-        status_values = [status.value for status in statuses]
-        placeholders = ",".join("?" for _ in status_values)
-        query = f"""
-            SELECT * FROM scraping_tasks
-            WHERE batch_id = ? AND status IN ({placeholders})
-            ORDER BY order_num ASC
-        """
+        # Los estados viajan como un arreglo JSON: el texto SQL es fijo y la
+        # caché de sentencias de sqlite3 lo reutiliza sin importar cuántos sean.
+        status_values = json.dumps([status.value for status in statuses])
         with self.get_connection() as conn:
-            rows = conn.execute(query, (batch_id, *status_values)).fetchall()
-        return [self._row_to_task(row) for row in rows]
+            cursor = conn.execute(
+                """
+                SELECT * FROM scraping_tasks
+                WHERE batch_id = ? AND status IN (SELECT value FROM json_each(?))
+                ORDER BY order_num ASC
+                """,
+                (batch_id, status_values),
+            )
+            return [self._row_to_task(row) for row in cursor]
 
     def all_tasks(self, batch_id: str) -> list[ScrapingTask]:
+        # Se itera el cursor directamente: sqlite3 entrega las filas conforme se
+        # leen y no se guarda una lista de ``Row`` junto a la de tareas.
         with self.get_connection() as conn:
-            rows = conn.execute(
+            cursor = conn.execute(
                 "SELECT * FROM scraping_tasks WHERE batch_id = ? ORDER BY order_num ASC",
                 (batch_id,),
-            ).fetchall()
-        return [self._row_to_task(row) for row in rows]
+            )
+            return [self._row_to_task(row) for row in cursor]
 
     def pending_counts(self, batch_id: str) -> dict[str, int]:
         with self.get_connection() as conn:
@@ -313,86 +424,137 @@ class TaskRepository:
 
     def detail_tasks_ready(self, batch_id: str) -> list[ScrapingTask]:
         with self.get_connection() as conn:
-            rows = conn.execute(
+            cursor = conn.execute(
                 """
                 SELECT * FROM scraping_tasks
                 WHERE batch_id = ? AND is_detail = 1 AND status = 'pending'
                 ORDER BY order_num ASC
                 """,
                 (batch_id,),
-            ).fetchall()
-        return [self._row_to_task(row) for row in rows]
+            )
+            return [self._row_to_task(row) for row in cursor]
 
     def mark_task_running(self, task: ScrapingTask) -> None:
+        where, params = self._task_match(task)
         with self.get_connection() as conn:
             conn.execute(
-                """
+                f"""
                 UPDATE scraping_tasks
                 SET status = 'running', started_at = CURRENT_TIMESTAMP, attempts = COALESCE(attempts, 0)
-                WHERE batch_id = ? AND task_key = ?
+                WHERE {where}
                 """,
-                (task.batch_id, task.task_key()),
+                params,
             )
             conn.commit()
 
     def mark_task_completed(self, task: ScrapingTask, output_path: Optional[Path]) -> None:
         with self.get_connection() as conn:
-            conn.execute(
-                """
-                UPDATE scraping_tasks
-                SET status = 'completed', completed_at = CURRENT_TIMESTAMP, output_path = ?
-                WHERE batch_id = ? AND task_key = ?
-                """,
-                (str(output_path) if output_path else None, task.batch_id, task.task_key()),
-            )
+            self._set_task_completed(conn, task, output_path)
             conn.commit()
 
     def mark_task_failed(self, task: ScrapingTask, error: str, will_retry: bool) -> None:
-        status = 'retrying' if will_retry else 'failed'
         with self.get_connection() as conn:
-            conn.execute(
-                """
-                UPDATE scraping_tasks
-                SET status = ?, error_message = ?, attempts = attempts + 1,
-                    completed_at = CASE WHEN ? = 'failed' THEN CURRENT_TIMESTAMP ELSE completed_at END
-                WHERE batch_id = ? AND task_key = ?
-                """,
-                (status, error, status, task.batch_id, task.task_key()),
-            )
+            self._set_task_failed(conn, task, error, will_retry)
             conn.commit()
 
     def release_detail_tasks(self, main_task: ScrapingTask, dependency_path: Path) -> list[ScrapingTask]:
         with self.get_connection() as conn:
-            rows = conn.execute(
-                """
-                SELECT * FROM scraping_tasks
-                WHERE batch_id = ? AND depends_on = ? AND is_detail = 1 AND status = 'blocked'
-                """,
-                (main_task.batch_id, main_task.task_key()),
-            ).fetchall()
-            if not rows:
-                return []
-            conn.execute(
-                """
-                UPDATE scraping_tasks
-                SET status = 'pending', dependency_path = ?
-                WHERE batch_id = ? AND depends_on = ? AND is_detail = 1 AND status = 'blocked'
-                """,
-                (str(dependency_path), main_task.batch_id, main_task.task_key()),
-            )
+            released = self._release_detail_rows(conn, main_task, dependency_path)
+            conn.commit()
+        return released
+
+    def complete_task(
+        self, task: ScrapingTask, output_path: Optional[Path], *, release_details: bool = False
+    ) -> list[ScrapingTask]:
+        """Cierra una tarea correcta en una sola transacción.
+
+        Marca la tarea, suma al avance del lote y, si se pide, libera sus
+        tareas de detalle; devuelve las tareas liberadas.
+        """
+
+        with self.get_connection() as conn:
+            self._set_task_completed(conn, task, output_path)
+            self._add_batch_progress(conn, task.batch_id, 1, 0)
+            released: list[ScrapingTask] = []
+            if release_details and output_path:
+                released = self._release_detail_rows(conn, task, output_path)
             conn.commit()
-        return [self._row_to_task(row) for row in rows]
+        return released
+
+    def fail_task(self, task: ScrapingTask, error: str, will_retry: bool) -> None:
+        """Registra el fallo y, si ya no habrá reintento, el avance del lote, en una transacción."""
+
+        with self.get_connection() as conn:
+            self._set_task_failed(conn, task, error, will_retry)
+            if not will_retry:
+                self._add_batch_progress(conn, task.batch_id, 0, 1)
+            conn.commit()
+
+    def _set_task_completed(
+        self, conn: sqlite3.Connection, task: ScrapingTask, output_path: Optional[Path]
+    ) -> None:
+        where, params = self._task_match(task)
+        conn.execute(
+            f"""
+            UPDATE scraping_tasks
+            SET status = 'completed', completed_at = CURRENT_TIMESTAMP, output_path = ?
+            WHERE {where}
+            """,
+            (str(output_path) if output_path else None, *params),
+        )
+
+    def _set_task_failed(
+        self, conn: sqlite3.Connection, task: ScrapingTask, error: str, will_retry: bool
+    ) -> None:
+        status = 'retrying' if will_retry else 'failed'
+        where, params = self._task_match(task)
+        conn.execute(
+            f"""
+            UPDATE scraping_tasks
+            SET status = ?, error_message = ?, attempts = attempts + 1,
+                completed_at = CASE WHEN ? = 'failed' THEN CURRENT_TIMESTAMP ELSE completed_at END
+            WHERE {where}
+            """,
+            (status, error, status, *params),
+        )
+
+    def _release_detail_rows(
+        self, conn: sqlite3.Connection, main_task: ScrapingTask, dependency_path: Path
+    ) -> list[ScrapingTask]:
+        rows = conn.execute(
+            """
+            SELECT * FROM scraping_tasks
+            WHERE batch_id = ? AND depends_on = ? AND is_detail = 1 AND status = 'blocked'
+            """,
+            (main_task.batch_id, main_task.task_key()),
+        ).fetchall()
+        if not rows:
+            return []
+        conn.execute(
+            """
+            UPDATE scraping_tasks
+            SET status = 'pending', dependency_path = ?
+            WHERE batch_id = ? AND depends_on = ? AND is_detail = 1 AND status = 'blocked'
+            """,
+            (str(dependency_path), main_task.batch_id, main_task.task_key()),
+        )
+        released = [self._row_to_task(row) for row in rows]
+        # Las filas se leyeron antes del UPDATE: se reflejan su nuevo estado y ruta.
+        for task in released:
+            task.status = TaskStatus.PENDING
+            task.dependency_path = dependency_path
+        return released
 
     def blocked_detail_tasks(self, batch_id: str) -> list[ScrapingTask]:
         with self.get_connection() as conn:
-            rows = conn.execute(
+            cursor = conn.execute(
                 """
                 SELECT * FROM scraping_tasks
                 WHERE batch_id = ? AND is_detail = 1 AND status = 'blocked'
                 """,
                 (batch_id,),
-            ).fetchall()
-        return [self._row_to_task(row) for row in rows]
+            )
+            return [self._row_to_task(row) for row in cursor]
 
     def remaining_task_count(self, batch_id: str) -> int:
         with self.get_connection() as conn:
@@ -425,6 +587,18 @@ class TaskRepository:
         return None
 
     # ------------------------------------------------------------------
+    @staticmethod
+    def _task_match(task: ScrapingTask) -> tuple[str, tuple[object, ...]]:
+        """Filtro ``WHERE`` para actualizar una tarea concreta.
+
+        Las tareas leídas de la base traen su ``id`` y se actualizan por clave
+        primaria; sólo las que aún no se han releído usan ``(batch_id, task_key)``.
+        """
+
+        if task.id is not None:
+            return "id = ?", (task.id,)
+        return "batch_id = ? AND task_key = ?", (task.batch_id, task.task_key())
+
     def _row_to_task(self, row: sqlite3.Row) -> ScrapingTask:
         task = ScrapingTask(
             scraper_name=row["scraper_name"],
@@ -1,7 +1,7 @@
 """Modelos de datos utilizados por el sistema de orquestación."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
@@ -51,10 +51,17 @@ class ScrapingTask:
     depends_on: Optional[str] = None
     dependency_path: Optional[Path] = None
     output_path: Optional[Path] = None
+    _task_key: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def task_key(self) -> str:
-        """Cadena única para identificar el trabajo dentro del lote."""
+        """Cadena única para identificar el trabajo dentro del lote.
 
+        Los campos que la componen no cambian tras construir la tarea, por lo
+        que la cadena se calcula una sola vez y se reutiliza.
+        """
+
+        if self._task_key is not None:
+            return self._task_key
         tokens = [
             self.scraper_name,
             self.website_code or self.website,
@@ -64,7 +71,8 @@ class ScrapingTask:
             str(self.order),
             "detail" if self.is_detail else "main",
         ]
-        return "::".join(tokens)
+        self._task_key = "::".join(tokens)
+        return self._task_key
 
     def expected_filename(self, month_year: str, execution_number: int) -> str:
         prefix = self.website_code or self.website
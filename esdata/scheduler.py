@@ -38,6 +38,9 @@ class OrchestratorRunner:
         self.resource_limiter = ResourceLimiter(cpu_target=0.8, memory_target=0.8)
         self.retry_delay = max(self.config.retry_delay_minutes(), 1)
         self.max_parallel = self.config.max_parallel_scrapers()
+        # Directorios de salida ya creados: las tareas de detalle y los
+        # reintentos escriben en la misma carpeta que su tarea principal.
+        self._known_dirs: set[Path] = set()
 
     # ------------------------------------------------------------------
     # Preparación del lote
@@ -55,6 +58,7 @@ class OrchestratorRunner:
         self.repository.insert_tasks(batch_id, tasks)
         self.repository.reset_running_tasks(batch_id)
         batch = self.repository.create_batch(batch_id, month_year, execution_number, total_tasks=len(tasks))
+        self.repository.checkpoint()
         logger.info("Lote preparado %s con %d tareas", batch.batch_id, len(tasks))
         return batch
 
@@ -65,6 +69,9 @@ class OrchestratorRunner:
         active_sites: set[str] = set()
         retry_heap: List[tuple[float, ScrapingTask]] = []
         running: Dict[str, asyncio.Task[TaskExecutionResult]] = {}
+        started = monotonic()
+        completed_count = 0
+        failed_count = 0
 
         tasks = self.repository.all_tasks(batch.batch_id)
         for task in tasks:
@@ -127,9 +134,17 @@ class OrchestratorRunner:
                 made_progress = await schedule_next_task()
             if not running:
                 self._requeue_ready_retries(retry_heap, pending_main, detail_queue)
-                if not running and not any(pending_main.values()) and not detail_queue and not retry_heap:
+                has_ready_work = any(pending_main.values()) or bool(detail_queue)
+                if not running and not has_ready_work and not retry_heap:
                     break
-                await asyncio.sleep(1)
+                if has_ready_work:
+                    # Hay tareas listas pero el limitador de recursos las frena.
+                    delay = 1.0
+                else:
+                    # Sólo quedan reintentos: se duerme hasta que venza el primero
+                    # en lugar de despertar cada segundo durante ``retry_delay``.
+                    delay = max(retry_heap[0][0] - monotonic(), 0.0)
+                await asyncio.sleep(delay)
                 continue
             done, _ = await asyncio.wait(running.values(), return_when=asyncio.FIRST_COMPLETED)
             for finished in done:
@@ -139,27 +154,35 @@ class OrchestratorRunner:
                 running.pop(key, None)
                 site_code = task.website_code or task.website
                 active_sites.discard(site_code)
+                # Cada resultado se guarda en una sola transacción (tarea, avance
+                # del lote y detalles liberados) en lugar de una por escritura.
                 if result.success:
-                    self.repository.mark_task_completed(task, result.output_path)
-                    self.repository.update_batch_progress(batch.batch_id, completed_delta=1)
-                    logger.info("Tarea completada %s", key)
-                    if not task.is_detail and result.output_path:
-                        released = self.repository.release_detail_tasks(task, result.output_path)
-                        for detail_task in released:
-                            detail_queue.append(detail_task)
+                    released = self.repository.complete_task(
+                        task, result.output_path, release_details=not task.is_detail
+                    )
+                    completed_count += 1
+                    logger.debug("Tarea completada %s", key)
+                    detail_queue.extend(released)
                 else:
                     logger.error("Tarea falló %s: %s", key, result.error)
                     will_retry = task.attempts + 1 < task.max_attempts
-                    self.repository.mark_task_failed(task, result.error or "Error desconocido", will_retry)
+                    self.repository.fail_task(task, result.error or "Error desconocido", will_retry)
                     if will_retry:
                         task.attempts += 1
                         due_time = monotonic() + self.retry_delay * 60
                         heapq.heappush(retry_heap, (due_time, task))
                     else:
-                        self.repository.update_batch_progress(batch.batch_id, failed_delta=1)
+                        failed_count += 1
             # loop to schedule new tasks after completions
         self.repository.mark_batch_completed(batch.batch_id)
-        logger.info("Lote %s completado", batch.batch_id)
+        self.repository.checkpoint()
+        logger.info(
+            "Lote %s completado: %d tareas correctas, %d fallidas en %.1f s",
+            batch.batch_id,
+            completed_count,
+            failed_count,
+            monotonic() - started,
+        )
 
     # ------------------------------------------------------------------
     async def _launch_task(self, task: ScrapingTask, batch: ExecutionBatch, running: Dict[str, asyncio.Task], active_sites: set[str]) -> None:
@@ -173,19 +196,15 @@ class OrchestratorRunner:
 
     async def _execute_task(self, task: ScrapingTask, batch: ExecutionBatch) -> TaskExecutionResult:
         output_dir = self._build_output_dir(task, batch)
-        output_dir.mkdir(parents=True, exist_ok=True)
+        if output_dir not in self._known_dirs:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(output_dir)
         output_file = output_dir / task.expected_filename(batch.month_year, batch.execution_number)
         dependency = task.dependency_path
         try:
-            loop = asyncio.get_running_loop()
-            result_path = await loop.run_in_executor(
-                None,
-                self.adapter.run,
-                task,
-                output_file,
-                dependency,
-                batch,
-            )
+            # El adaptador espera al subproceso dentro del bucle de eventos; el
+            # límite de concurrencia lo impone ``max_parallel`` al lanzar tareas.
+            result_path = await self.adapter.run(task, output_file, dependency, batch)
             final_path = Path(result_path) if result_path else output_file
             return TaskExecutionResult(task=task, success=True, output_path=final_path)
         except Exception as exc:  # pragma: no cover - errores de scraping
@@ -16,14 +16,16 @@ los CSV y la escritura de archivos en disco para que cada scraper se limite
 """
 from __future__ import annotations
 
+import csv
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
+import fnmatch
 import logging
 import os
 from pathlib import Path
+import re
 from typing import Iterable, Optional, Sequence
-
-import pandas as pd
+import unicodedata
 
 __all__ = [
     "ScraperContext",
@@ -34,6 +36,25 @@ __all__ = [
     "generate_detail_rows",
 ]
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_SEED_KEY_COLUMNS = ["PaginaWeb", "Ciudad", "Operacion", "ProductoPaginaWeb"]
+
+
+class _CombiningMarkTable(dict):
+    """Tabla para ``str.translate`` que elimina marcas diacríticas combinantes.
+
+    Cada punto de código se clasifica una sola vez con
+    :func:`unicodedata.combining`; las consultas posteriores se resuelven en C.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        value = None if unicodedata.combining(chr(codepoint)) else codepoint
+        self[codepoint] = value
+        return value
+
+
+_STRIP_COMBINING = _CombiningMarkTable()
+
 
 @dataclass(slots=True)
 class ScraperContext:
@@ -57,6 +78,7 @@ class ScraperContext:
     items_per_page: int
     rate_limit: float
     timestamp: datetime
+    timestamp_iso: str
     url_list_file: Optional[Path]
     logger: logging.Logger
 
@@ -69,27 +91,30 @@ def build_context(scraper_name: str) -> ScraperContext:
     """
 
     scraper_id = scraper_name.lower()
-    mode = os.environ.get("SCRAPER_MODE", "url").strip().lower()
-    base_dir = Path(os.environ.get("SCRAPER_BASE_DIR") or Path.cwd())
+    # ``os.environ`` se resuelve una sola vez; las consultas usan ``.get`` directo
+    # sin copiar ni decodificar el resto del entorno.
+    env = os.environ
+    mode = env.get("SCRAPER_MODE", "url").strip().lower()
+    base_dir = Path(env.get("SCRAPER_BASE_DIR") or Path.cwd())
 
-    output_file_env = os.environ.get("SCRAPER_OUTPUT_FILE")
+    output_file_env = env.get("SCRAPER_OUTPUT_FILE")
     output_file = Path(output_file_env).resolve() if output_file_env else None
 
-    website = os.environ.get("SCRAPER_WEBSITE") or scraper_name.title()
-    website_code = os.environ.get("SCRAPER_WEBSITE_CODE") or website
-    city = os.environ.get("SCRAPER_CITY", "")
-    city_code = os.environ.get("SCRAPER_CITY_CODE") or city
-    operation = os.environ.get("SCRAPER_OPERATION", "")
-    operation_code = os.environ.get("SCRAPER_OPERATION_CODE") or operation
-    product = os.environ.get("SCRAPER_PRODUCT", "")
-    product_code = os.environ.get("SCRAPER_PRODUCT_CODE") or product
-    batch_id = os.environ.get("SCRAPER_BATCH_ID", "")
-
-    max_pages = _safe_int(os.environ.get("SCRAPER_MAX_PAGES"), default=5, minimum=1)
+    website = env.get("SCRAPER_WEBSITE") or scraper_name.title()
+    website_code = env.get("SCRAPER_WEBSITE_CODE") or website
+    city = env.get("SCRAPER_CITY", "")
+    city_code = env.get("SCRAPER_CITY_CODE") or city
+    operation = env.get("SCRAPER_OPERATION", "")
+    operation_code = env.get("SCRAPER_OPERATION_CODE") or operation
+    product = env.get("SCRAPER_PRODUCT", "")
+    product_code = env.get("SCRAPER_PRODUCT_CODE") or product
+    batch_id = env.get("SCRAPER_BATCH_ID", "")
+
+    max_pages = _safe_int(env.get("SCRAPER_MAX_PAGES"), default=5, minimum=1)
     items_per_page = _safe_int(
-        os.environ.get("SCRAPER_ITEMS_PER_PAGE"), default=5, minimum=1
+        env.get("SCRAPER_ITEMS_PER_PAGE"), default=5, minimum=1
     )
-    rate_limit = _safe_float(os.environ.get("SCRAPER_RATE_LIMIT"), default=0.0)
+    rate_limit = _safe_float(env.get("SCRAPER_RATE_LIMIT"), default=0.0)
 
     logger = logging.getLogger(f"scraper.{scraper_id}")
     if not logging.getLogger().handlers:
@@ -98,9 +123,9 @@ def build_context(scraper_name: str) -> ScraperContext:
             format="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
         )
 
-    timestamp = datetime.utcnow()
+    timestamp = datetime.now(timezone.utc)
 
-    url = os.environ.get("SCRAPER_INPUT_URL", "").strip()
+    url = env.get("SCRAPER_INPUT_URL", "").strip()
     if not url and mode != "detail":
         url = _resolve_seed_url(
             scraper_id,
@@ -115,7 +140,12 @@ def build_context(scraper_name: str) -> ScraperContext:
     url_list_file = None
     if mode == "detail":
         url_list_file = _resolve_url_list_file(
-            scraper_id, output_file, website, website_code, logger
+            scraper_id,
+            output_file,
+            website,
+            website_code,
+            logger,
+            env_path=env.get("SCRAPER_URL_LIST_FILE"),
         )
 
     return ScraperContext(
@@ -137,6 +167,7 @@ def build_context(scraper_name: str) -> ScraperContext:
         items_per_page=items_per_page,
         rate_limit=rate_limit,
         timestamp=timestamp,
+        timestamp_iso=timestamp.isoformat(timespec="seconds"),
         url_list_file=url_list_file,
         logger=logger,
     )
@@ -160,7 +191,8 @@ def run_main_scraper(context: ScraperContext) -> bool:
         return True
 
     rows = generate_listing_rows(context)
-    _write_rows(context.output_file, rows, dedup_key="listing_url")
+    # Página + elemento hacen única cada URL generada.
+    _write_rows(context.output_file, rows, dedup_key="listing_url", rows_unique=True)
     context.logger.info(
         "Se generaron %d URLs sintéticas en %s",
         len(rows),
@@ -222,32 +254,35 @@ def generate_listing_rows(context: ScraperContext) -> list[dict[str, object]]:
     )
     pages = max(1, min(context.max_pages, 10))
     items = max(1, min(context.items_per_page, 20))
-    timestamp = context.timestamp.isoformat()
 
+    # Las claves variables se declaran en el prototipo para conservar el orden
+    # de columnas; cada fila es una copia en C que solo sobrescribe esos campos.
+    prototype: dict[str, object] = {
+        "source_scraper": context.scraper_name,
+        "website": context.website,
+        "website_code": context.website_code,
+        "city": context.city,
+        "city_code": context.city_code,
+        "operation": context.operation,
+        "operation_code": context.operation_code,
+        "product": context.product,
+        "product_code": context.product_code,
+        "listing_url": None,
+        "collected_at": context.timestamp_iso,
+        "page_number": None,
+        "item_number": None,
+        "batch_id": context.batch_id,
+    }
     rows: list[dict[str, object]] = []
-    base_url = context.url.rstrip("/")
+    url_prefix = f"{context.url.rstrip('/')}/listing-{slug}-"
     for page in range(1, pages + 1):
+        page_prefix = f"{url_prefix}{page:02d}-"
         for item in range(1, items + 1):
-            listing_id = f"{slug}-{page:02d}-{item:03d}"
-            listing_url = f"{base_url}/listing-{listing_id}"
-            rows.append(
-                {
-                    "source_scraper": context.scraper_name,
-                    "website": context.website,
-                    "website_code": context.website_code,
-                    "city": context.city,
-                    "city_code": context.city_code,
-                    "operation": context.operation,
-                    "operation_code": context.operation_code,
-                    "product": context.product,
-                    "product_code": context.product_code,
-                    "listing_url": listing_url,
-                    "collected_at": timestamp,
-                    "page_number": page,
-                    "item_number": item,
-                    "batch_id": context.batch_id,
-                }
-            )
+            row = prototype.copy()
+            row["listing_url"] = f"{page_prefix}{item:03d}"
+            row["page_number"] = page
+            row["item_number"] = item
+            rows.append(row)
     return rows
 
 
@@ -256,30 +291,34 @@ def generate_detail_rows(
 ) -> list[dict[str, object]]:
     """Genera información sintética de detalle a partir de las URLs recibidas."""
 
-    timestamp = context.timestamp.isoformat()
+    prototype: dict[str, object] = {
+        "source_scraper": context.scraper_name,
+        "website": context.website,
+        "website_code": context.website_code,
+        "city": context.city,
+        "city_code": context.city_code,
+        "operation": context.operation,
+        "operation_code": context.operation_code,
+        "product": context.product,
+        "product_code": context.product_code,
+        "listing_url": None,
+        "detail_id": None,
+        "title": None,
+        "description": None,
+        "price_hint": None,
+        "scraped_at": context.timestamp_iso,
+        "batch_id": context.batch_id,
+    }
+    title_prefix = f"{context.website} {context.product} #"
     rows: list[dict[str, object]] = []
     for index, url in enumerate(urls, start=1):
-        listing_id = _slugify(Path(url).name or f"{context.scraper_name}-{index}")
-        rows.append(
-            {
-                "source_scraper": context.scraper_name,
-                "website": context.website,
-                "website_code": context.website_code,
-                "city": context.city,
-                "city_code": context.city_code,
-                "operation": context.operation,
-                "operation_code": context.operation_code,
-                "product": context.product,
-                "product_code": context.product_code,
-                "listing_url": url,
-                "detail_id": listing_id,
-                "title": f"{context.website} {context.product} #{index}",
-                "description": f"Detalle sintético generado para {url}",
-                "price_hint": 1000000 + index * 2500,
-                "scraped_at": timestamp,
-                "batch_id": context.batch_id,
-            }
-        )
+        row = prototype.copy()
+        row["listing_url"] = url
+        row["detail_id"] = _slugify(Path(url).name or f"{context.scraper_name}-{index}")
+        row["title"] = f"{title_prefix}{index}"
+        row["description"] = f"Detalle sintético generado para {url}"
+        row["price_hint"] = 1000000 + index * 2500
+        rows.append(row)
     return rows
 
 
@@ -317,36 +356,33 @@ def _resolve_seed_url(
         base_dir / "urls" / f"{scraper_name}_urls.csv",
         base_dir / "Urls" / f"{scraper_name}_urls.csv",
     ]
+    target = [str(value).strip() for value in (website, city, operation, product)]
     for path in candidates:
         if not path.exists():
             continue
+        fallback = ""
         try:
-            df = pd.read_csv(path, encoding="utf-8")
-        except Exception as exc:  # pragma: no cover - diagnóstico
+            with path.open("r", encoding="utf-8-sig", newline="") as handle:
+                reader = csv.DictReader(handle)
+                header = reader.fieldnames or []
+                missing = next(
+                    (column for column in [*_SEED_KEY_COLUMNS, "URL"] if column not in header), None
+                )
+                if missing:
+                    logger.warning("CSV %s carece de columna %s", path, missing)
+                    continue
+                for row in reader:
+                    url_val = (row["URL"] or "").strip()
+                    if not url_val:
+                        continue
+                    if [(row[column] or "").strip() for column in _SEED_KEY_COLUMNS] == target:
+                        return url_val
+                    fallback = fallback or url_val
+        except (OSError, UnicodeDecodeError, csv.Error) as exc:  # pragma: no cover - diagnóstico
             logger.warning("No se pudo leer %s: %s", path, exc)
             continue
-        for column in ["PaginaWeb", "Ciudad", "Operacion", "ProductoPaginaWeb", "URL"]:
-            if column not in df.columns:
-                logger.warning("CSV %s carece de columna %s", path, column)
-                break
-        else:
-            mask = (
-                df["PaginaWeb"].astype(str).str.strip() == str(website).strip()
-            )
-            mask &= df["Ciudad"].astype(str).str.strip() == str(city).strip()
-            mask &= df["Operacion"].astype(str).str.strip() == str(operation).strip()
-            mask &= (
-                df["ProductoPaginaWeb"].astype(str).str.strip()
-                == str(product).strip()
-            )
-            row = df[mask].head(1)
-            if not row.empty:
-                url_val = row.iloc[0].get("URL")
-                if pd.notna(url_val):
-                    return str(url_val).strip()
-            for url_val in df.get("URL", []):
-                if pd.notna(url_val) and str(url_val).strip():
-                    return str(url_val).strip()
+        if fallback:
+            return fallback
     logger.warning(
         "No se encontró URL semilla para %s (%s, %s, %s, %s)",
         scraper_name,
@@ -364,10 +400,11 @@ def _resolve_url_list_file(
     website: str,
     website_code: str,
     logger: logging.Logger,
+    *,
+    env_path: Optional[str] = None,
 ) -> Optional[Path]:
     """Localiza el archivo puente con las URLs principales."""
 
-    env_path = os.environ.get("SCRAPER_URL_LIST_FILE")
     if env_path:
         path = Path(env_path)
         if path.exists():
@@ -387,48 +424,157 @@ def _resolve_url_list_file(
     ]
 
     for directory in search_dirs:
+        names = _list_csv_names(directory)
         for prefix in prefixes:
-            pattern = f"{prefix}_*.csv"
-            matches = sorted(directory.glob(pattern))
+            matches = sorted(fnmatch.filter(names, f"{prefix}_*.csv"))
             if matches:
-                return matches[-1]
+                return directory / matches[-1]
     logger.info(
         "No se localizó archivo puente para %s en %s", scraper_name, search_dirs
     )
     return None
 
 
+def _list_csv_names(directory: Path) -> list[str]:
+    """Lista una sola vez los ``*.csv`` de ``directory`` para filtrarlos en memoria.
+
+    No se cachea entre llamadas: el archivo puente puede haberse creado
+    instantes antes por el scraper principal.
+    """
+
+    try:
+        with os.scandir(directory) as entries:
+            return [entry.name for entry in entries if entry.name.endswith(".csv")]
+    except OSError:
+        return []
+
+
 def _write_rows(
-    output_file: Path, rows: Iterable[dict[str, object]], *, dedup_key: Optional[str]
+    output_file: Path,
+    rows: Iterable[dict[str, object]],
+    *,
+    dedup_key: Optional[str],
+    rows_unique: bool = False,
 ) -> Path:
+    """Escribe ``rows`` en ``output_file`` sin duplicar ``dedup_key``.
+
+    Con ``rows_unique=True`` el llamador garantiza que las filas nuevas no se
+    repiten entre sí y solo se deduplica contra un archivo previo.
+    """
+
     output_file.parent.mkdir(parents=True, exist_ok=True)
-    df_new = pd.DataFrame(list(rows))
-    if output_file.exists():
-        try:
-            df_prev = pd.read_csv(output_file, encoding="utf-8")
-        except Exception:  # pragma: no cover - archivos externos corruptos
-            df_prev = pd.DataFrame()
-        if not df_prev.empty:
-            df_new = pd.concat([df_prev, df_new], ignore_index=True)
-    if dedup_key and dedup_key in df_new.columns:
-        df_new.drop_duplicates(subset=[dedup_key], inplace=True, ignore_index=True)
-    df_new.to_csv(output_file, index=False, encoding="utf-8")
+    rows = list(rows)
+    if output_file.exists() and _append_rows(output_file, rows, dedup_key=dedup_key):
+        return output_file
+    fieldnames = list(rows[0]) if rows else []
+    if dedup_key and not rows_unique and dedup_key in fieldnames:
+        unique: dict[object, dict[str, object]] = {}
+        for row in rows:
+            unique.setdefault(row[dedup_key], row)
+        rows = list(unique.values())
+    with output_file.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.writer(handle, lineterminator="\n")
+        writer.writerow(fieldnames)
+        writer.writerows([[row.get(name) for name in fieldnames] for row in rows])
     return output_file
 
 
+def _append_rows(
+    output_file: Path, rows: Sequence[dict[str, object]], *, dedup_key: Optional[str]
+) -> bool:
+    """Agrega al CSV existente solo las filas cuya ``dedup_key`` no aparece aún.
+
+    Únicamente se recorre la columna de deduplicación del archivo previo, sin
+    reescribirlo, salvo que las filas nuevas traigan columnas que el archivo no
+    tiene: entonces se reescribe con la unión de encabezados (como hacía
+    ``pd.concat``) para no perder datos. Devuelve ``False`` cuando el archivo no
+    tiene encabezado y debe escribirse desde cero.
+    """
+
+    try:
+        with output_file.open("r", encoding="utf-8", newline="") as handle:
+            reader = csv.reader(handle)
+            # El encabezado se conserva tal cual, con nombres vacíos incluidos, para
+            # que los índices coincidan con las posiciones reales del archivo.
+            header = next(reader, [])
+            seen: set[str] = set()
+            if dedup_key and dedup_key in header:
+                index = header.index(dedup_key)
+                seen = {row[index] for row in reader if len(row) > index}
+    except (OSError, UnicodeDecodeError, csv.Error):  # pragma: no cover - archivos externos corruptos
+        return False
+    if not any(header):
+        return False
+
+    pending: list[dict[str, object]] = []
+    for row in rows:
+        if dedup_key:
+            key = str(row.get(dedup_key, ""))
+            if key in seen:
+                continue
+            seen.add(key)
+        pending.append(row)
+    if not pending:
+        return True
+    known = {name for name in header if name}
+    extra = list(dict.fromkeys(name for row in pending for name in row if name and name not in known))
+    if extra:
+        _rewrite_with_columns(output_file, header, extra, pending)
+        return True
+    with output_file.open("a", encoding="utf-8", newline="") as handle:
+        writer = csv.writer(handle, lineterminator="\n")
+        writer.writerows([[row.get(name) for name in header] for row in pending])
+    return True
+
+
+def _rewrite_with_columns(
+    output_file: Path,
+    header: list[str],
+    extra: list[str],
+    rows: Sequence[dict[str, object]],
+) -> None:
+    """Reescribe ``output_file`` con ``header + extra`` y agrega ``rows``.
+
+    Las filas previas quedan vacías en las columnas nuevas; el archivo se
+    sustituye de forma atómica.
+    """
+
+    fieldnames = header + extra
+    width = len(header)
+    padding = [""] * len(extra)
+    tmp_path = output_file.with_name(f"{output_file.name}.{os.getpid()}.tmp")
+    try:
+        with output_file.open("r", encoding="utf-8", newline="") as source, tmp_path.open(
+            "w", encoding="utf-8", newline=""
+        ) as target:
+            reader = csv.reader(source)
+            next(reader, None)
+            writer = csv.writer(target, lineterminator="\n")
+            writer.writerow(fieldnames)
+            writer.writerows(row[:width] + [""] * (width - len(row)) + padding for row in reader)
+            writer.writerows([[row.get(name) for name in fieldnames] for row in rows])
+        os.replace(tmp_path, output_file)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
 def _load_url_list(context: ScraperContext) -> list[str]:
     path = context.url_list_file
     if not path or not path.exists():
         return []
     try:
-        df = pd.read_csv(path, encoding="utf-8")
-    except Exception as exc:  # pragma: no cover - diagnóstico
+        # Lectura en streaming: solo se conserva la columna de URLs.
+        with path.open("r", encoding="utf-8", newline="") as handle:
+            reader = csv.reader(handle)
+            header = next(reader, [])
+            for column in ("listing_url", "url"):
+                if column in header:
+                    index = header.index(column)
+                    values = (row[index].strip() for row in reader if len(row) > index)
+                    return [value for value in values if value]
+    except (OSError, UnicodeDecodeError, csv.Error) as exc:  # pragma: no cover - diagnóstico
         context.logger.warning("No se pudo leer %s: %s", path, exc)
         return []
-    for column in ("listing_url", "url"):
-        if column in df.columns:
-            values = [str(value).strip() for value in df[column].dropna()]
-            return [value for value in values if value]
     context.logger.warning(
         "El archivo %s no contiene columnas 'listing_url' o 'url'", path
     )
@@ -436,11 +582,5 @@ def _load_url_list(context: ScraperContext) -> list[str]:
 
 
 def _slugify(value: str) -> str:
-    import re
-    import unicodedata
-
-    normalized = unicodedata.normalize("NFKD", value)
-    normalized = "".join(ch for ch in normalized if not unicodedata.combining(ch))
-    normalized = normalized.lower()
-    normalized = re.sub(r"[^a-z0-9]+", "-", normalized)
-    return normalized.strip("-")
+    normalized = unicodedata.normalize("NFKD", value).translate(_STRIP_COMBINING)
+    return _SLUG_RE.sub("-", normalized.lower()).strip("-")
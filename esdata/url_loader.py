@@ -1,10 +1,10 @@
 """Carga y normalización de URLs de scraping desde los CSV de entrada."""
 from __future__ import annotations
 
-import pandas as pd
-from datetime import datetime
+import csv
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from .configuration import ConfigManager
 from .models import ScrapingTask, TaskStatus
@@ -27,59 +27,70 @@ class UrlLoader:
         csv_path = self.urls_dir / f"{scraper_name.lower()}_urls.csv"
         if not csv_path.exists():
             return []
-        df = pd.read_csv(csv_path, encoding="utf-8")
-        if not set(self.REQUIRED_COLUMNS).issubset(df.columns):
-            missing = set(self.REQUIRED_COLUMNS) - set(df.columns)
-            raise ValueError(f"CSV {csv_path} no contiene columnas requeridas: {missing}")
-
         max_attempts = int(self.config.execution_settings().get("max_retry_attempts", 3))
         tasks: List[ScrapingTask] = []
+        # Todas las tareas de un mismo archivo comparten la marca de creación.
+        created_at = datetime.now(timezone.utc)
+        # Scraper de detalle por sitio: pocos sitios y muchas filas por archivo.
+        detail_names: dict[str, Optional[str]] = {}
 
-        for index, row in df.iterrows():
-            website_code, website_value = self.config.normalize("websites", row.get("PaginaWeb"))
-            city_code, city_value = self.config.normalize("cities", row.get("Ciudad"))
-            operation_code, operation_value = self.config.normalize("operations", row.get("Operacion"))
-            product_code, product_value = self.config.normalize("products", row.get("ProductoPaginaWeb"))
-            url_value = str(row.get("URL") or "").strip()
-
-            task = ScrapingTask(
-                scraper_name=scraper_name.lower(),
-                website=website_value,
-                city=city_value,
-                operation=operation_value,
-                product=product_value,
-                url=url_value,
-                order=index + 1,
-                status=TaskStatus.PENDING,
-                max_attempts=max_attempts,
-                created_at=datetime.utcnow(),
-                website_code=website_code,
-                city_code=city_code,
-                operation_code=operation_code,
-                product_code=product_code,
-            )
-            tasks.append(task)
+        # Lectura en streaming con el módulo csv: las celdas ya son cadenas y no
+        # hace falta construir un DataFrame para recorrer cinco columnas.
+        with csv_path.open("r", encoding="utf-8-sig", newline="") as handle:
+            reader = csv.DictReader(handle)
+            if not set(self.REQUIRED_COLUMNS).issubset(reader.fieldnames or ()):
+                missing = set(self.REQUIRED_COLUMNS) - set(reader.fieldnames or ())
+                raise ValueError(f"CSV {csv_path} no contiene columnas requeridas: {missing}")
+            for index, row in enumerate(reader):
+                website_raw, city_raw, operation_raw, product_raw, url_raw = (
+                    row[column] for column in self.REQUIRED_COLUMNS
+                )
+                website_code, website_value = self.config.normalize("websites", website_raw)
+                city_code, city_value = self.config.normalize("cities", city_raw)
+                operation_code, operation_value = self.config.normalize("operations", operation_raw)
+                product_code, product_value = self.config.normalize("products", product_raw)
+                url_value = str(url_raw or "").strip()
 
-            detail_name = self.config.detail_scraper_for(website_code)
-            if detail_name:
-                detail_task = ScrapingTask(
-                    scraper_name=detail_name.lower(),
+                task = ScrapingTask(
+                    scraper_name=scraper_name.lower(),
                     website=website_value,
                     city=city_value,
                     operation=operation_value,
                     product=product_value,
                     url=url_value,
                     order=index + 1,
-                    status=TaskStatus.BLOCKED,
+                    status=TaskStatus.PENDING,
                     max_attempts=max_attempts,
-                    created_at=datetime.utcnow(),
+                    created_at=created_at,
                     website_code=website_code,
                     city_code=city_code,
                     operation_code=operation_code,
                     product_code=product_code,
-                    is_detail=True,
-                    depends_on=task.task_key(),
                 )
-                tasks.append(detail_task)
+                tasks.append(task)
+
+                if website_code not in detail_names:
+                    detail_names[website_code] = self.config.detail_scraper_for(website_code)
+                detail_name = detail_names[website_code]
+                if detail_name:
+                    detail_task = ScrapingTask(
+                        scraper_name=detail_name.lower(),
+                        website=website_value,
+                        city=city_value,
+                        operation=operation_value,
+                        product=product_value,
+                        url=url_value,
+                        order=index + 1,
+                        status=TaskStatus.BLOCKED,
+                        max_attempts=max_attempts,
+                        created_at=created_at,
+                        website_code=website_code,
+                        city_code=city_code,
+                        operation_code=operation_code,
+                        product_code=product_code,
+                        is_detail=True,
+                        depends_on=task.task_key(),
+                    )
+                    tasks.append(detail_task)
 
         return tasks
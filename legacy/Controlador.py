@@ -3,10 +3,20 @@ Controlador de la versión anterior. Conservado solo como referencia.
 """
 
 import os
-import Herramientas as h  # type: ignore
-from Orquestador import Orquestador  # type: ignore
+import warnings
+
+warnings.warn(
+    "legacy/Controlador.py está deprecado; usa orchestrator.py",
+    DeprecationWarning,
+    stacklevel=2,
+)
+
 
 def main():
+    # Importaciones diferidas: importar este módulo no arrastra la pila antigua.
+    import Herramientas as h  # type: ignore
+    from Orquestador import Orquestador  # type: ignore
+
     h.crear_carpetas_necesarias()
     base_path = os.path.dirname(os.path.abspath(__file__))
     urls_path = os.path.join(base_path, 'urls')
@@ -3,12 +3,11 @@
 from __future__ import annotations
 
 import argparse
-from datetime import datetime
+import json
+from datetime import timedelta
 from pathlib import Path
 from typing import Iterable, Optional
 
-from tabulate import tabulate
-
 from esdata.configuration import ConfigManager
 from esdata.database import TaskRepository
 from esdata.models import TaskStatus
@@ -34,71 +33,71 @@ def parse_args() -> argparse.Namespace:
 
 def get_repository() -> TaskRepository:
     config = ConfigManager(BASE_DIR)
-    return TaskRepository(BASE_DIR / config.raw["database"]["path"])
+    db_path = BASE_DIR / config.raw["database"]["path"]
+    # El monitor sólo lee; sin base previa se crea el esquema vacío como antes.
+    return TaskRepository(db_path, read_only=db_path.exists())
 
 
 def cmd_overview(repo: TaskRepository) -> None:
-    batch = repo.find_open_batch()
-    if not batch:
-        with repo.get_connection() as conn:
-            row = conn.execute(
-                "SELECT * FROM execution_batches ORDER BY started_at DESC LIMIT 1"
-            ).fetchone()
-        if not row:
-            print("Sin ejecuciones registradas")
-            return
-        batch = repo.batch_by_id(row["batch_id"])
-    assert batch
+    summary = repo.latest_batch_summary()
+    if not summary:
+        print("Sin ejecuciones registradas")
+        return
+    batch, table = summary
     print(f"Lote: {batch.batch_id} | Estado: {batch.status}")
     print(f"Iniciado: {batch.started_at}")
     if batch.completed_at:
         print(f"Finalizado: {batch.completed_at}")
-    with repo.get_connection() as conn:
-        rows = conn.execute(
-            """
-            SELECT status, COUNT(*) as total
-            FROM scraping_tasks
-            WHERE batch_id = ?
-            GROUP BY status
-            ORDER BY status
-            """,
-            (batch.batch_id,),
-        ).fetchall()
-    table = [(row["status"], row["total"]) for row in rows]
-    print(tabulate(table, headers=["Estado", "Cantidad"], tablefmt="github"))
+    # tabulate se importa sólo al imprimir: los caminos sin tabla no lo cargan.
+    from tabulate import tabulate
+
+    # ``disable_numparse`` marca las columnas de texto para que tabulate no
+    # intente interpretar cada celda como número.
+    print(tabulate(table, headers=["Estado", "Cantidad"], tablefmt="github", disable_numparse=[0]))
 
 
 def cmd_batches(repo: TaskRepository, limit: int) -> None:
     with repo.get_connection() as conn:
-        rows = conn.execute(
+        # Filas como tuplas: se desempaquetan por posición sin la búsqueda por
+        # nombre de ``sqlite3.Row`` en cada celda.
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(
             """
-            SELECT batch_id, month_year, execution_number, status, started_at, completed_at,
-                   total_tasks, completed_tasks, failed_tasks
+            SELECT batch_id, status, total_tasks, completed_tasks, failed_tasks,
+                   CAST(strftime('%s', completed_at) AS INTEGER)
+                       - CAST(strftime('%s', started_at) AS INTEGER) AS duration_seconds
             FROM execution_batches
             ORDER BY started_at DESC
             LIMIT ?
             """,
             (limit,),
-        ).fetchall()
-    if not rows:
-        print("Sin historial disponible")
-        return
-    table = []
-    for row in rows:
-        started = datetime.fromisoformat(row["started_at"]) if row["started_at"] else None
-        finished = datetime.fromisoformat(row["completed_at"]) if row["completed_at"] else None
-        duration = (finished - started) if started and finished else "-"
-        table.append(
+        )
+        # La tabla se arma conforme el cursor entrega filas, sin ``fetchall``.
+        table = [
             [
-                row["batch_id"],
-                row["status"],
-                row["total_tasks"] or 0,
-                row["completed_tasks"] or 0,
-                row["failed_tasks"] or 0,
-                duration,
+                batch_id,
+                status,
+                total or 0,
+                completed or 0,
+                failed or 0,
+                timedelta(seconds=seconds) if seconds is not None else "-",
             ]
+            for batch_id, status, total, completed, failed, seconds in cursor
+        ]
+    if not table:
+        print("Sin historial disponible")
+        return
+    from tabulate import tabulate
+
+    print(
+        tabulate(
+            table,
+            headers=["Lote", "Estado", "Total", "Completadas", "Fallidas", "Duración"],
+            tablefmt="github",
+            disable_numparse=[0, 1, 5],
         )
-    print(tabulate(table, headers=["Lote", "Estado", "Total", "Completadas", "Fallidas", "Duración"], tablefmt="github"))
+    )
 
 
 def cmd_tasks(repo: TaskRepository, statuses: Optional[Iterable[str]], batch_id: Optional[str]) -> None:
@@ -109,12 +108,22 @@ def cmd_tasks(repo: TaskRepository, statuses: Optional[Iterable[str]], batch_id:
             return
         batch_id = batch.batch_id
     with repo.get_connection() as conn:
+        # Las columnas ya vienen en el orden de la tabla: las tuplas se pasan
+        # directo a tabulate.
+        cursor = conn.cursor()
+        cursor.row_factory = None
         if statuses:
-            placeholders = ",".join("?" for _ in statuses)
-            query = f"SELECT scraper_name, website_code, city_code, operation_code, product_code, status, attempts FROM scraping_tasks WHERE batch_id = ? AND status IN ({placeholders}) ORDER BY scraper_name, order_num"
-            rows = conn.execute(query, (batch_id, *statuses)).fetchall()
+            rows = cursor.execute(
+                """
+                SELECT scraper_name, website_code, city_code, operation_code, product_code, status, attempts
+                FROM scraping_tasks
+                WHERE batch_id = ? AND status IN (SELECT value FROM json_each(?))
+                ORDER BY scraper_name, order_num
+                """,
+                (batch_id, json.dumps(list(statuses))),
+            ).fetchall()
         else:
-            rows = conn.execute(
+            rows = cursor.execute(
                 """
                 SELECT scraper_name, website_code, city_code, operation_code, product_code, status, attempts
                 FROM scraping_tasks
@@ -126,32 +135,32 @@ def cmd_tasks(repo: TaskRepository, statuses: Optional[Iterable[str]], batch_id:
     if not rows:
         print("Sin tareas que coincidan con el filtro")
         return
-    table = [
-        [
-            row["scraper_name"],
-            row["website_code"],
-            row["city_code"],
-            row["operation_code"],
-            row["product_code"],
-            row["status"],
-            row["attempts"],
-        ]
-        for row in rows
-    ]
-    print(tabulate(table, headers=["Scraper", "Sitio", "Ciudad", "Operación", "Producto", "Estado", "Intentos"], tablefmt="github"))
+    from tabulate import tabulate
+
+    print(
+        tabulate(
+            rows,
+            headers=["Scraper", "Sitio", "Ciudad", "Operación", "Producto", "Estado", "Intentos"],
+            tablefmt="github",
+            disable_numparse=[0, 1, 2, 3, 4, 5],
+        )
+    )
 
 
 def main() -> None:
     args = parse_args()
     repo = get_repository()
-    if args.command == "overview":
-        cmd_overview(repo)
-    elif args.command == "batches":
-        cmd_batches(repo, args.limit)
-    elif args.command == "tasks":
-        cmd_tasks(repo, args.status, args.batch)
-    else:
-        raise SystemExit("Comando no soportado")
+    try:
+        if args.command == "overview":
+            cmd_overview(repo)
+        elif args.command == "batches":
+            cmd_batches(repo, args.limit)
+        elif args.command == "tasks":
+            cmd_tasks(repo, args.status, args.batch)
+        else:
+            raise SystemExit("Comando no soportado")
+    finally:
+        repo.close()
 
 
 if __name__ == "__main__":
@@ -6,6 +6,7 @@ import argparse
 import asyncio
 import logging
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterable, List
 
@@ -51,9 +52,15 @@ def parse_args() -> argparse.Namespace:
 
 def load_tasks(config: ConfigManager, scrapers: Iterable[str]) -> List[ScrapingTask]:
     loader = UrlLoader(config)
+    scrapers = list(scrapers)
     tasks: List[ScrapingTask] = []
-    for scraper in scrapers:
-        loaded = loader.load(scraper)
+    if not scrapers:
+        return tasks
+    # Los CSV son independientes: se leen en paralelo y ``map`` conserva el
+    # orden de ``scrapers`` para que el plan y los ``order`` no cambien.
+    with ThreadPoolExecutor(max_workers=len(scrapers), thread_name_prefix="urls") as executor:
+        results = list(executor.map(loader.load, scrapers))
+    for scraper, loaded in zip(scrapers, results):
         if not loaded:
             logger.warning("No se encontraron URLs para %s", scraper)
             continue
@@ -80,32 +87,17 @@ def cmd_plan(config: ConfigManager, args: argparse.Namespace) -> None:
 
 
 def cmd_status(repo: TaskRepository) -> None:
-    batch = repo.find_open_batch()
-    if not batch:
+    # Lote abierto (o el último registrado) y sus tareas por estado en una sola consulta.
+    summary = repo.latest_batch_summary()
+    if not summary:
+        logger.info("Sin historial de ejecuciones")
+        return
+    batch, counts = summary
+    if batch.status not in ("running", "created"):
         logger.info("No hay lotes en ejecución. Revisando último completado...")
-        with repo.get_connection() as conn:
-            row = conn.execute(
-                "SELECT * FROM execution_batches ORDER BY started_at DESC LIMIT 1"
-            ).fetchone()
-        if not row:
-            logger.info("Sin historial de ejecuciones")
-            return
-        batch = repo.batch_by_id(row["batch_id"])
-    assert batch
     logger.info("Lote %s - estado: %s", batch.batch_id, batch.status)
-    with repo.get_connection() as conn:
-        rows = conn.execute(
-            """
-            SELECT status, COUNT(*) as total
-            FROM scraping_tasks
-            WHERE batch_id = ?
-            GROUP BY status
-            ORDER BY status
-            """,
-            (batch.batch_id,),
-        ).fetchall()
-    for row in rows:
-        logger.info("  %-10s %4d", row["status"], row["total"])
+    for status, total in counts:
+        logger.info("  %-10s %4d", status, total)
 
 
 def cmd_run(config: ConfigManager, repo: TaskRepository, args: argparse.Namespace) -> None:
@@ -144,17 +136,20 @@ def main() -> None:
     config = ConfigManager(BASE_DIR)
     repo = TaskRepository(BASE_DIR / config.raw["database"]["path"])
 
-    if args.command == "plan":
-        cmd_plan(config, args)
-    elif args.command == "status":
-        cmd_status(repo)
-    elif args.command == "resume":
-        args.resume = True
-        cmd_run(config, repo, args)
-    elif args.command == "run":
-        cmd_run(config, repo, args)
-    else:
-        raise SystemExit("Comando no soportado")
+    try:
+        if args.command == "plan":
+            cmd_plan(config, args)
+        elif args.command == "status":
+            cmd_status(repo)
+        elif args.command == "resume":
+            args.resume = True
+            cmd_run(config, repo, args)
+        elif args.command == "run":
+            cmd_run(config, repo, args)
+        else:
+            raise SystemExit("Comando no soportado")
+    finally:
+        repo.close()
 
 
 if __name__ == "__main__":
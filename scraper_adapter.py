@@ -1,35 +1,54 @@
 """Adaptador responsable de ejecutar los scrapers dentro del orquestador."""
 from __future__ import annotations
 
-import importlib.util
+import asyncio
+from collections import deque
 import logging
 import os
-from contextlib import contextmanager
 from pathlib import Path
-from types import ModuleType
-from typing import Optional
+from typing import Iterable, Optional
 
 from esdata.configuration import ConfigManager
 from esdata.models import ExecutionBatch, ScrapingTask
 
 logger = logging.getLogger(__name__)
 
+# Líneas finales de salida que se conservan para diagnosticar un fallo.
+OUTPUT_TAIL_LINES = 50
+# La salida se lee en bloques de este tamaño y se parte en líneas por ``\n`` o
+# ``\r`` (las barras de progreso sólo usan ``\r``).
+OUTPUT_CHUNK_SIZE = 64 * 1024
+# Bytes que se conservan de una línea; el resto de una línea más larga (volcados
+# de HTML, barras de progreso sin salto) se descarta sin afectar a la tarea.
+OUTPUT_LINE_LIMIT = 1024 * 1024
+
 
 class ScraperExecutionError(RuntimeError):
     """Error lanzado cuando un scraper no genera la salida esperada."""
 
 
 class ScraperAdapter:
-    """Carga dinámica de scrapers y preparación de variables de entorno."""
+    """Ejecuta cada scraper en un proceso propio con su entorno y directorio.
+
+    Nada del proceso del orquestador (``os.environ``, directorio actual,
+    módulos importados) se modifica. Los procesos se lanzan y se esperan desde
+    el bucle de eventos, así varias tareas corren en paralelo sin ocupar un
+    hilo cada una.
+    """
 
     def __init__(self, base_dir: Path, config: ConfigManager):
         self.base_dir = Path(base_dir)
         self.config = config
         self.scrapers_dir = self.base_dir / self.config.raw["scrapers"]["path"]
         self.scrapers_dir.mkdir(parents=True, exist_ok=True)
+        self.python_executable = self.config.python_executable()
+        self.timeout_seconds = self.config.scraper_timeout_seconds()
+        # Scripts ya localizados: sólo se consulta el disco la primera vez por
+        # scraper; los que faltan se vuelven a buscar por si se agregan después.
+        self._script_paths: dict[str, Path] = {}
 
     # ------------------------------------------------------------------
-    def run(
+    async def run(
         self,
         task: ScrapingTask,
         output_file: Path,
@@ -38,48 +57,33 @@ class ScraperAdapter:
     ) -> Path:
         """Ejecuta el scraper indicado y devuelve la ruta final generada."""
 
-        script_path = self.scrapers_dir / f"{task.scraper_name}.py"
-        if not script_path.exists():
-            raise ScraperExecutionError(f"Scraper no encontrado: {script_path}")
+        script_path = self._script_path(task.scraper_name)
         if task.is_detail and dependency_path and not dependency_path.exists():
             raise ScraperExecutionError(
                 f"Archivo de dependencia no disponible: {dependency_path}"
             )
 
-        module = self._load_module(script_path)
-        with self._temporary_workdir(self.scrapers_dir):
-            with self._patched_environment(task, output_file, dependency_path, batch):
-                self._invoke_scraper(module, output_file)
+        env = self._build_environment(task, output_file, dependency_path, batch)
+        await self._run_process(task, script_path, env)
         return self._ensure_output_file(task, output_file)
 
     # ------------------------------------------------------------------
-    def _load_module(self, script_path: Path) -> ModuleType:
-        spec = importlib.util.spec_from_file_location(script_path.stem, script_path)
-        if spec is None or spec.loader is None:
-            raise ScraperExecutionError(
-                f"No se pudo cargar el módulo del scraper: {script_path}"
-            )
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)  # type: ignore[assignment]
-        return module
-
-    @contextmanager
-    def _temporary_workdir(self, path: Path):
-        original = Path.cwd()
-        os.chdir(path)
-        try:
-            yield
-        finally:
-            os.chdir(original)
-
-    @contextmanager
-    def _patched_environment(
+    def _script_path(self, scraper_name: str) -> Path:
+        script_path = self._script_paths.get(scraper_name)
+        if script_path is None:
+            script_path = self.scrapers_dir / f"{scraper_name}.py"
+            if not script_path.exists():
+                raise ScraperExecutionError(f"Scraper no encontrado: {script_path}")
+            self._script_paths[scraper_name] = script_path
+        return script_path
+
+    def _build_environment(
         self,
         task: ScrapingTask,
         output_file: Path,
         dependency_path: Optional[Path],
         batch: Optional[ExecutionBatch],
-    ):
+    ) -> dict[str, str]:
         updates = {
             "SCRAPER_MODE": "detail" if task.is_detail else "url",
             "SCRAPER_OUTPUT_FILE": str(output_file),
@@ -109,28 +113,82 @@ class ScraperAdapter:
         except Exception:
             pass
 
-        previous_values = {key: os.environ.get(key) for key in updates}
-        os.environ.update({k: v for k, v in updates.items() if v is not None})
+        env = dict(os.environ)
+        env.update({k: v for k, v in updates.items() if v is not None})
+        # Los scrapers importan ``esdata`` desde la raíz del proyecto.
+        env["PYTHONPATH"] = os.pathsep.join(
+            filter(None, (str(self.base_dir), os.environ.get("PYTHONPATH")))
+        )
+        env["PYTHONIOENCODING"] = "utf-8"
+        return env
+
+    async def _run_process(self, task: ScrapingTask, script_path: Path, env: dict[str, str]) -> None:
+        """Ejecuta el scraper y reenvía su salida al log conforme se produce.
+
+        Cada línea va a ``DEBUG`` en cuanto llega; sólo se conservan las últimas
+        ``OUTPUT_TAIL_LINES`` para mostrarlas en ``WARNING`` si el scraper falla,
+        así la memoria no crece con ejecuciones largas.
+        """
+
+        process = await asyncio.create_subprocess_exec(
+            self.python_executable,
+            str(script_path),
+            cwd=self.scrapers_dir,
+            env=env,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+        tail: deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+
+        def emit(raw: bytes) -> None:
+            line = raw.decode("utf-8", errors="replace").rstrip()
+            if line.strip():
+                tail.append(line)
+                logger.debug("[%s] %s", task.scraper_name, line)
+
+        async def relay_output() -> int:
+            # Lectura por bloques en lugar de ``readline``: una línea enorme se
+            # recorta en vez de abortar la lectura y matar a un scraper sano.
+            assert process.stdout is not None
+            partial = bytearray()
+            while chunk := await process.stdout.read(OUTPUT_CHUNK_SIZE):
+                *complete, rest = chunk.replace(b"\r", b"\n").split(b"\n")
+                for piece in complete:
+                    partial += piece[: OUTPUT_LINE_LIMIT - len(partial)]
+                    emit(bytes(partial))
+                    partial.clear()
+                partial += rest[: OUTPUT_LINE_LIMIT - len(partial)]
+            if partial:
+                emit(bytes(partial))
+            return await process.wait()
 
         try:
-            yield
+            returncode = await asyncio.wait_for(relay_output(), self.timeout_seconds)
+        except asyncio.TimeoutError:
+            self._relay_tail(task, tail)
+            raise ScraperExecutionError(
+                f"El scraper {task.scraper_name} excedió el tiempo límite de "
+                f"{self.timeout_seconds:.0f} s"
+            ) from None
         finally:
-            for key, value in previous_values.items():
-                if value is None:
-                    os.environ.pop(key, None)
-                else:
-                    os.environ[key] = value
-
-    def _invoke_scraper(self, module: ModuleType, output_file: Path) -> None:
-        if hasattr(module, "DDIR"):
-            setattr(module, "DDIR", str(output_file.parent) + os.sep)  # type: ignore[attr-defined]
-        if hasattr(module, "main") and callable(module.main):  # type: ignore[attr-defined]
-            module.main()  # type: ignore[attr-defined]
-        else:
+            # Tiempo agotado, cancelación o error al leer: el hijo no debe quedar vivo.
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+
+        if returncode != 0:
+            self._relay_tail(task, tail)
+            detail = f": {tail[-1]}" if tail else ""
             raise ScraperExecutionError(
-                "El scraper no expone una función main() ejecutable"
+                f"El scraper {task.scraper_name} terminó con código {returncode}{detail}"
             )
 
+    def _relay_tail(self, task: ScrapingTask, tail: Iterable[str]) -> None:
+        """Muestra en ``WARNING`` las últimas líneas de un scraper fallido."""
+
+        for line in tail:
+            logger.warning("[%s] %s", task.scraper_name, line)
+
     def _ensure_output_file(self, task: ScrapingTask, output_file: Path) -> Path:
         if output_file.exists():
             return output_file
@@ -7,14 +7,19 @@ Este script utiliza la lógica de los scrapers originales pero la adapta para
 funcionar en un entorno de prueba controlado, guardando los resultados en
 el directorio /temp.
 """
+import csv
+import json
 import os
 import re
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import pandas as pd
+import lxml.etree
+import lxml.html
 from bs4 import BeautifulSoup
 from seleniumbase import Driver
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -28,10 +33,18 @@ BASE_URLS_TO_TEST = [
 PAGES_PER_URL = 5 # Reducido de 30 a 5 para agilizar la prueba
 URLS_PER_PAGE_LIMIT = 5 # Limitar el número de anuncios por página para acelerar
 DETAIL_SCRAPE_LIMIT = 10 # Limitar el número total de detalles a scrapear
+DETAIL_WORKERS = 3 # Navegadores en paralelo para la fase de detalle (ajustar según la máquina)
+HTML_PARSER = "lxml" # Parser en C; mucho más rápido que 'html.parser' en páginas grandes
 
 TEMP_DIR = Path("temp")
 URL_LIST_OUTPUT_FILE = TEMP_DIR / "inm24_test_urls.csv"
 DETAIL_OUTPUT_FILE = TEMP_DIR / "inm24_test_details.csv"
+DETAIL_SPOOL_TEMPLATE = "inm24_test_details_{}.jsonl" # Un spool por navegador
+# Perfiles persistentes de Chrome: cookies y almacenamiento local sobreviven entre
+# corridas y evitan repetir consentimientos y desafíos anti-bot. Uno por navegador
+# simultáneo, porque Chrome bloquea el perfil en uso.
+PROFILES_DIR = TEMP_DIR / "chrome-profiles"
+MAIN_PROFILE = "inm24"
 
 # --- Configuración de Logging ---
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -40,94 +53,228 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 BROWSER_OPTIONS = {
     "uc": True,
     "headed": True,
+    "page_load_strategy": "eager", # Devuelve el control con el DOM listo, sin esperar recursos
     "args": [
         "--no-sandbox",
         "--disable-dev-shm-usage",
         "--disable-gpu",
-        "--window-size=1280,1024"
+        "--window-size=1280,1024",
+        "--blink-settings=imagesEnabled=false",
+        # Servicios de Chrome que no aportan al scraping y consumen CPU/memoria por página
+        "--disable-features=Translate,MediaRouter,OptimizationHints,InterestFeedContentSuggestions,CalculateNativeWinOcclusion,IsolateOrigins,site-per-process",
+        "--disable-background-networking",
+        "--disable-sync",
+        "--disable-default-apps",
+        "--no-first-run",
+        "--disable-extensions",
+        "--disable-renderer-backgrounding",
+        "--metrics-recording-only"
     ]
 }
+# Recursos que no aportan datos. El CSS se conserva: uc_gui_click_captcha hace
+# clic por coordenadas y necesita el layout renderizado.
+BLOCKED_URL_PATTERNS = [
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm", "*.webp", "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*facebook.net*", "*hotjar.com*",
+]
+
+def launch_driver(profile: str = MAIN_PROFILE):
+    """Abre un navegador con las opciones de prueba y bloquea recursos pesados vía CDP.
+
+    ``profile`` elige el directorio de perfil persistente bajo ``PROFILES_DIR``.
+    """
+    user_data_dir = PROFILES_DIR / profile
+    user_data_dir.mkdir(parents=True, exist_ok=True)
+    driver = Driver(**BROWSER_OPTIONS, user_data_dir=str(user_data_dir))
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        logging.warning(f"No se pudo configurar el bloqueo de recursos vía CDP: {e}")
+    return driver
 
 # --- Lógica del Scraper Principal (inm24_original.py) ---
 
-def scrape_main_page_source(html: str) -> pd.DataFrame:
-    """Extrae los datos básicos de una página de resultados."""
-    columns = ['nombre', 'descripcion', 'ubicacion', 'url', 'precio', 'tipo', 'habitaciones', 'baños']
-    data = []
-    soup = BeautifulSoup(html, 'html.parser')
-    cards = soup.find_all("div", class_="postingCardLayout-module__posting-card-layout")
+def _has_class(class_name: str) -> str:
+    """Predicado XPath equivalente a ``class_=`` de BeautifulSoup."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+CARD_XPATH = lxml.etree.XPath(f".//div[{_has_class('postingCardLayout-module__posting-card-layout')}]")
+CARD_DESCRIPTION_LINK_XPATH = lxml.etree.XPath("(.//h3[@data-qa='POSTING_CARD_DESCRIPTION'])[1]//a")
+CARD_PRICE_XPATH = lxml.etree.XPath(".//div[@data-qa='POSTING_CARD_PRICE']")
+CARD_ADDRESS_XPATH = lxml.etree.XPath(f".//div[{_has_class('postingLocations-module__location-address')}]")
+CARD_LOCATION_XPATH = lxml.etree.XPath(".//h2[@data-qa='POSTING_CARD_LOCATION']")
+CARD_FEATURE_SPANS_XPATH = lxml.etree.XPath("(.//h3[@data-qa='POSTING_CARD_FEATURES'])[1]//span")
+
+# Parser compartido entre páginas; sin nodos de comentarios ni PIs el árbol es más chico.
+# Solo lo usa el hilo analizador de la fase 1 (los parsers de lxml no admiten uso concurrente).
+HTML_TREE_PARSER = lxml.html.HTMLParser(recover=True, remove_comments=True, remove_pis=True)
+
+def _first(node, xpath: lxml.etree.XPath):
+    matches = xpath(node)
+    return matches[0] if matches else None
+
+def _node_text(node) -> str:
+    """Equivalente a ``get_text(strip=True)`` de BeautifulSoup."""
+    if len(node) == 0:
+        # Nodo hoja (el caso común en enlaces y precios): no hace falta recorrer el subárbol
+        return (node.text or "").strip()
+    return "".join(text.strip() for text in node.itertext())
+
+def _card_fields(card) -> dict:
+    """Campos crudos de una tarjeta analizada con lxml (misma forma que ``CARD_FIELDS_JS``)."""
+    link_a = _first(card, CARD_DESCRIPTION_LINK_XPATH)
+    price_div = _first(card, CARD_PRICE_XPATH)
+    address_div = _first(card, CARD_ADDRESS_XPATH)
+    loc_h2 = _first(card, CARD_LOCATION_XPATH)
+    return {
+        "link": (link_a.get('href', ''), _node_text(link_a)) if link_a is not None else None,
+        "price": _node_text(price_div) if price_div is not None else None,
+        "address": _node_text(address_div) if address_div is not None else None,
+        "location": _node_text(loc_h2) if loc_h2 is not None else None,
+        "features": [_node_text(sp) for sp in CARD_FEATURE_SPANS_XPATH(card)],
+    }
 
-    for i, card in enumerate(cards):
-        if i >= URLS_PER_PAGE_LIMIT:
-            break
-        temp_dict = {col: None for col in columns}
+MAIN_COLUMNS = ['nombre', 'descripcion', 'ubicacion', 'url', 'precio', 'tipo', 'habitaciones', 'baños']
+
+def _card_rows(cards) -> list[dict]:
+    """Convierte los campos crudos de cada tarjeta en filas; descarta las que no tienen URL."""
+    data = []
+    for fields in cards:
+        temp_dict = {col: None for col in MAIN_COLUMNS}
         temp_dict['tipo'] = 'venta'
-        desc_h3 = card.find("h3", {"data-qa": "POSTING_CARD_DESCRIPTION"})
-        if desc_h3 and (link_a := desc_h3.find("a")):
-            temp_dict['nombre'] = link_a.get_text(strip=True)
-            temp_dict['descripcion'] = link_a.get_text(strip=True)
-            temp_dict['url'] = "https://www.inmuebles24.com" + link_a.get('href', '')
+        if fields["link"] is not None:
+            href, link_text = fields["link"]
+            temp_dict['nombre'] = link_text
+            temp_dict['descripcion'] = link_text
+            temp_dict['url'] = "https://www.inmuebles24.com" + href
         
-        if price_div := card.find("div", {"data-qa": "POSTING_CARD_PRICE"}):
-            temp_dict['precio'] = price_div.get_text(strip=True)
+        if fields["price"] is not None:
+            temp_dict['precio'] = fields["price"]
             
-        address_div = card.find("div", class_="postingLocations-module__location-address")
-        address_txt = address_div.get_text(strip=True) if address_div else ""
-        loc_h2 = card.find("h2", {"data-qa": "POSTING_CARD_LOCATION"})
-        loc_txt = loc_h2.get_text(strip=True) if loc_h2 else ""
+        address_txt = fields["address"] or ""
+        loc_txt = fields["location"] or ""
         temp_dict['ubicacion'] = f"{address_txt}, {loc_txt}" if address_txt and loc_txt else address_txt or loc_txt
         
-        if features := card.find("h3", {"data-qa": "POSTING_CARD_FEATURES"}):
-            for sp in features.find_all("span"):
-                txt = sp.get_text(strip=True).lower()
-                if "rec" in txt: temp_dict['habitaciones'] = txt
-                if "bañ" in txt: temp_dict['baños'] = txt
+        for feature in fields["features"]:
+            txt = feature.lower()
+            if "rec" in txt: temp_dict['habitaciones'] = txt
+            if "bañ" in txt: temp_dict['baños'] = txt
         
         if temp_dict.get('url'):
             data.append(temp_dict)
             
-    return pd.DataFrame(data)
+    return data
+
+def scrape_main_page_source(html: str) -> list[dict]:
+    """Extrae los datos básicos de una página de resultados a partir de su HTML.
+
+    Usa ``lxml`` directamente: las tarjetas solo requieren búsquedas simples y
+    el árbol envolvente de BeautifulSoup era el costo dominante.
+    """
+    tree = lxml.html.fromstring(html, parser=HTML_TREE_PARSER)
+    return _card_rows(_card_fields(card) for card in CARD_XPATH(tree)[:URLS_PER_PAGE_LIMIT])
+
+# Extracción dentro del navegador: devuelve solo los campos crudos de las primeras
+# ``arguments[0]`` tarjetas, con las mismas búsquedas y el mismo get_text(strip=True)
+# que ``_card_fields``, en lugar de copiar y re-parsear todo ``page_source``.
+CARD_FIELDS_JS = """
+const text = el => {
+    if (!el) return null;
+    const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+    let out = "";
+    while (walker.nextNode()) out += walker.currentNode.nodeValue.trim();
+    return out;
+};
+const cards = document.querySelectorAll("div.postingCardLayout-module__posting-card-layout");
+return Array.from(cards).slice(0, arguments[0]).map(card => {
+    const link = card.querySelector("h3[data-qa='POSTING_CARD_DESCRIPTION']")?.querySelector("a");
+    const features = card.querySelector("h3[data-qa='POSTING_CARD_FEATURES']");
+    return {
+        link: link ? [link.getAttribute("href") || "", text(link)] : null,
+        price: text(card.querySelector("div[data-qa='POSTING_CARD_PRICE']")),
+        address: text(card.querySelector("div.postingLocations-module__location-address")),
+        location: text(card.querySelector("h2[data-qa='POSTING_CARD_LOCATION']")),
+        features: features ? Array.from(features.querySelectorAll("span"), text) : [],
+    };
+});
+"""
+
+def _collect_page(url: str, future, unique_rows: dict[str, dict]) -> bool:
+    """Incorpora el resultado de una página ya analizada; ``False`` si no trae anuncios.
+
+    Las filas se deduplican por URL al vuelo (gana la primera aparición).
+    """
+    try:
+        page_rows = future.result()
+    except Exception as e:
+        logging.error(f"Error al procesar la página {url}: {e}")
+        return True
+    if not page_rows:
+        logging.warning("No se encontraron anuncios en la página.")
+        return False
+    for row in page_rows:
+        unique_rows.setdefault(row['url'], row)
+    logging.info(f"Se encontraron {len(page_rows)} anuncios en la página.")
+    return True
+
+def run_main_scraper_phase(driver=None):
+    """Ejecuta la fase de recolección de URLs.
 
-def run_main_scraper_phase():
-    """Ejecuta la fase de recolección de URLs."""
+    Si se recibe ``driver`` se reutiliza y no se cierra; quien lo creó lo cierra.
+    El análisis de cada página corre en segundo plano mientras el navegador
+    carga la siguiente.
+    """
     logging.info("--- INICIANDO FASE 1: Recolección de URLs ---")
     TEMP_DIR.mkdir(exist_ok=True)
-    all_urls_df = pd.DataFrame()
+    unique_rows = {} # URL -> fila; el DataFrame se construye una sola vez al final
     
-    driver = Driver(**BROWSER_OPTIONS)
+    owns_driver = driver is None
+    if owns_driver:
+        driver = launch_driver()
     try:
-        for base_url_template in BASE_URLS_TO_TEST:
-            logging.info(f"Procesando plantilla de URL: {base_url_template}")
-            for i in range(1, PAGES_PER_URL + 1):
-                url = base_url_template.format(i)
-                logging.info(f"Página {i}/{PAGES_PER_URL} - Navegando a: {url}")
-                try:
-                    driver.uc_open_with_reconnect(url, 5)
-                    WebDriverWait(driver, 15).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "div.postingCardLayout-module__posting-card-layout"))
-                    )
-                    driver.uc_gui_click_captcha()
-                    
-                    html = driver.page_source
-                    df_page = scrape_main_page_source(html)
-                    
-                    if not df_page.empty:
-                        all_urls_df = pd.concat([all_urls_df, df_page], ignore_index=True)
-                        logging.info(f"Se encontraron {len(df_page)} anuncios en la página.")
-                    else:
-                        logging.warning("No se encontraron anuncios en la página.")
-                        break # Si una página no tiene resultados, no seguimos con las siguientes de esa plantilla
+        with ThreadPoolExecutor(max_workers=1) as parser:
+            for base_url_template in BASE_URLS_TO_TEST:
+                logging.info(f"Procesando plantilla de URL: {base_url_template}")
+                pending = None # (url, futuro) de la página anterior
+                for i in range(1, PAGES_PER_URL + 1):
+                    url = base_url_template.format(i)
+                    logging.info(f"Página {i}/{PAGES_PER_URL} - Navegando a: {url}")
+                    job = None # (función, argumento) que produce las filas de la página
+                    try:
+                        driver.uc_open_with_reconnect(url, 5)
+                        WebDriverWait(driver, 15).until(
+                            EC.presence_of_element_located((By.CSS_SELECTOR, "div.postingCardLayout-module__posting-card-layout"))
+                        )
+                        driver.uc_gui_click_captcha()
+                        
+                        try:
+                            job = (_card_rows, driver.execute_script(CARD_FIELDS_JS, URLS_PER_PAGE_LIMIT))
+                        except WebDriverException as e:
+                            logging.warning(f"Extracción en el navegador fallida ({e}); se analiza page_source.")
+                            job = (scrape_main_page_source, driver.page_source)
+                    except Exception as e:
+                        logging.error(f"Error al procesar la página {url}: {e}")
 
-                except Exception as e:
-                    logging.error(f"Error al procesar la página {url}: {e}")
-                    continue
+                    if pending is not None and not _collect_page(*pending, unique_rows):
+                        pending = None
+                        break # Si una página no tiene resultados, no seguimos con las siguientes de esa plantilla
+                    pending = (url, parser.submit(*job)) if job is not None else None
+                if pending is not None:
+                    _collect_page(*pending, unique_rows)
     finally:
-        driver.quit()
+        if owns_driver:
+            driver.quit()
 
-    if not all_urls_df.empty:
-        all_urls_df.drop_duplicates(subset=['url'], inplace=True)
-        all_urls_df.to_csv(URL_LIST_OUTPUT_FILE, index=False)
-        logging.info(f"FASE 1 COMPLETA: Se guardaron {len(all_urls_df)} URLs en {URL_LIST_OUTPUT_FILE}")
+    if unique_rows:
+        # Las filas ya son únicas y de columnas fijas: se escriben directo, sin DataFrame
+        with URL_LIST_OUTPUT_FILE.open("w", encoding="utf-8", newline="") as handle:
+            writer = csv.DictWriter(handle, fieldnames=MAIN_COLUMNS, lineterminator="\n")
+            writer.writeheader()
+            writer.writerows(unique_rows.values())
+        logging.info(f"FASE 1 COMPLETA: Se guardaron {len(unique_rows)} URLs en {URL_LIST_OUTPUT_FILE}")
         return True
     else:
         logging.error("FASE 1 FALLIDA: No se recolectó ninguna URL.")
@@ -135,9 +282,22 @@ def run_main_scraper_phase():
 
 # --- Lógica del Scraper de Detalle (inm24_det_original.py) ---
 
+WHITESPACE_RE = re.compile(r'\s+')
+NEWLINES_RE = re.compile(r'[\r\n]+')
+# Orden de prioridad igual al de la cadena if/elif original
+ICON_FEATURE_KEYS = {
+    "icon-stotal": "area_total",
+    "icon-scubierta": "area_cubierta",
+    "icon-bano": "banos_icon",
+    "icon-cochera": "estacionamientos_icon",
+    "icon-dormitorio": "recamaras_icon",
+    "icon-toilete": "medio_banos_icon",
+    "icon-antiguedad": "antiguedad_icon",
+}
+
 def scrape_property_detail(html: str) -> dict:
     """Extrae todos los datos de la página de detalle de un inmueble."""
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER)
     data = {}
 
     # Título, tipo, área, etc.
@@ -166,17 +326,25 @@ def scrape_property_detail(html: str) -> dict:
     # Características de iconos
     if features_ul := soup.find("ul", id="section-icon-features-property"):
         for li in features_ul.find_all("li", class_="icon-feature"):
-            text = re.sub(r'\s+', ' ', li.get_text(" ", strip=True)).strip()
-            if "icon-stotal" in str(li): data["area_total"] = text
-            elif "icon-scubierta" in str(li): data["area_cubierta"] = text
-            elif "icon-bano" in str(li): data["banos_icon"] = text
-            elif "icon-cochera" in str(li): data["estacionamientos_icon"] = text
-            elif "icon-dormitorio" in str(li): data["recamaras_icon"] = text
-            elif "icon-toilete" in str(li): data["medio_banos_icon"] = text
-            elif "icon-antiguedad" in str(li): data["antiguedad_icon"] = text
+            text = WHITESPACE_RE.sub(' ', li.get_text(" ", strip=True)).strip()
+            # Solo las clases del <li> y sus hijos; evita re-serializar el HTML con str(li)
+            classes = " ".join(" ".join(tag.get("class", [])) for tag in (li, *li.find_all(class_=True)))
+            for icon_class, key in ICON_FEATURE_KEYS.items():
+                if icon_class in classes:
+                    data[key] = text
+                    break
             
     return data
 
+# Textos visibles de los <span> del primer <div> hermano siguiente del botón
+# (equivale a "./following-sibling::div"); null si el panel no existe.
+PANEL_SPANS_JS = """
+let panel = arguments[0].nextElementSibling;
+while (panel && panel.tagName !== "DIV") panel = panel.nextElementSibling;
+if (!panel) return null;
+return Array.from(panel.querySelectorAll("span"), span => span.innerText.trim()).filter(Boolean);
+"""
+
 def extract_information_after_click(driver) -> dict:
     """Hace clic en los botones de características y extrae la información."""
     info_botones = {}
@@ -196,11 +364,20 @@ def extract_information_after_click(driver) -> dict:
                 WebDriverWait(driver, 5).until(EC.element_to_be_clickable(button))
                 driver.execute_script("arguments[0].click();", button)
                 
-                # Esperar a que el contenido se despliegue
-                time.sleep(0.5) 
+                # Esperar a que el contenido se despliegue: continúa en cuanto aparece
+                # y nunca más que la pausa fija original de 0.5 s; sin contenido se
+                # registra vacío como antes
+                try:
+                    WebDriverWait(driver, 0.5, poll_frequency=0.1).until(
+                        lambda d: button.find_elements(By.XPATH, "./following-sibling::div//span")
+                    )
+                except TimeoutException:
+                    pass
 
-                details_container = button.find_element(By.XPATH, "./following-sibling::div")
-                features = [elem.text.strip() for elem in details_container.find_elements(By.TAG_NAME, "span") if elem.text.strip()]
+                # Una sola llamada a chromedriver por botón en lugar de una por cada span
+                features = driver.execute_script(PANEL_SPANS_JS, button)
+                if features is None:
+                    raise ValueError("no se encontró el panel desplegado")
                 info_botones[button_text] = "; ".join(features)
                 logging.info(f"  - Extraído de '{button_text}': {len(features)} items.")
             except Exception as e:
@@ -209,64 +386,157 @@ def extract_information_after_click(driver) -> dict:
         logging.error(f"Error al buscar botones de características: {e}")
     return info_botones
 
-def run_detail_scraper_phase():
-    """Ejecuta la fase de extracción de detalles."""
+def _write_detail_csv(spool_files: list[Path], output_file: Path) -> int:
+    """Convierte los spools JSONL de detalles en CSV sin cargarlos completos en memoria.
+
+    Las columnas siguen el orden de primera aparición (igual que el ``pd.DataFrame`` original),
+    porque los botones de características varían entre anuncios.
+    """
+    fieldnames: dict[str, None] = {}
+    for spool_file in spool_files:
+        with spool_file.open("r", encoding="utf-8") as spool:
+            for line in spool:
+                fieldnames.update(dict.fromkeys(json.loads(line)))
+
+    count = 0
+    with output_file.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=list(fieldnames), lineterminator="\n")
+        writer.writeheader()
+        for spool_file in spool_files:
+            with spool_file.open("r", encoding="utf-8") as spool:
+                for line in spool:
+                    row = json.loads(line)
+                    writer.writerow({key: NEWLINES_RE.sub(' ', value) if isinstance(value, str) else value for key, value in row.items()})
+                    count += 1
+    return count
+
+def open_detail_page(driver, url: str) -> None:
+    """Navega a un anuncio reutilizando la sesión y reconecta solo ante un desafío.
+
+    ``uc_open_with_reconnect`` desconecta y reconecta chromedriver en cada
+    llamada; con la sesión ya validada basta ``driver.get``. Si el título no
+    aparece (p. ej. un desafío anti-bot) se recurre a la reconexión UC.
+    """
+    title_present = EC.presence_of_element_located((By.CSS_SELECTOR, "h1.title-property"))
+    try:
+        driver.get(url)
+        WebDriverWait(driver, 10).until(title_present)
+    except TimeoutException:
+        logging.info(f"Sin título tras carga directa; reabriendo con reconexión: {url}")
+        driver.uc_open_with_reconnect(url, 5)
+        WebDriverWait(driver, 20).until(title_present)
+    try:
+        # Los datos ya están en el DOM: cortar la carga de recursos restantes
+        driver.execute_cdp_cmd("Page.stopLoading", {})
+    except WebDriverException:
+        pass
+
+def _scrape_detail_chunk(spool_file: Path, urls: list[str], offset: int, total: int, profile: str, driver=None) -> int:
+    """Procesa un bloque contiguo de URLs con su propio navegador.
+
+    Cada detalle se escribe al spool en cuanto se obtiene: memoria constante y
+    el progreso sobrevive a una caída del navegador. Un ``driver`` recibido se
+    reutiliza sin cerrarlo.
+    """
+    scraped = 0
+    owns_driver = driver is None
+    if owns_driver:
+        driver = launch_driver(profile)
+    try:
+        with spool_file.open("w", encoding="utf-8") as spool:
+            for i, url in enumerate(urls, offset + 1):
+                logging.info(f"Procesando URL {i}/{total}: {url}")
+                try:
+                    open_detail_page(driver, url)
+                    
+                    html = driver.page_source
+                    data = scrape_property_detail(html)
+                    data['url_origen'] = url
+                    
+                    botones_data = extract_information_after_click(driver)
+                    data.update(botones_data)
+                    
+                    spool.write(json.dumps(data, ensure_ascii=False) + "\n")
+                    spool.flush()
+                    scraped += 1
+                    
+                except Exception as e:
+                    logging.error(f"Error al procesar la URL de detalle {url}: {e}")
+                    continue
+    finally:
+        if owns_driver:
+            driver.quit()
+    return scraped
+
+def run_detail_scraper_phase(driver=None):
+    """Ejecuta la fase de extracción de detalles.
+
+    Si se recibe ``driver`` lo usa el primer bloque en lugar de abrir otro navegador.
+    """
     logging.info("--- INICIANDO FASE 2: Extracción de Detalles ---")
     if not URL_LIST_OUTPUT_FILE.exists():
         logging.error(f"No se encontró el archivo de URLs: {URL_LIST_OUTPUT_FILE}. Abortando fase 2.")
         return False
 
-    urls_df = pd.read_csv(URL_LIST_OUTPUT_FILE)
-    urls_to_scrape = urls_df["url"].dropna().unique().tolist()[:DETAIL_SCRAPE_LIMIT]
-    logging.info(f"Se van a procesar {len(urls_to_scrape)} URLs únicas (límite: {DETAIL_SCRAPE_LIMIT}).")
-    
-    all_details_data = []
-    
-    driver = Driver(**BROWSER_OPTIONS)
-    try:
-        for i, url in enumerate(urls_to_scrape, 1):
-            logging.info(f"Procesando URL {i}/{len(urls_to_scrape)}: {url}")
-            try:
-                driver.uc_open_with_reconnect(url, 5)
-                WebDriverWait(driver, 20).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "h1.title-property"))
-                )
-                
-                html = driver.page_source
-                data = scrape_property_detail(html)
-                data['url_origen'] = url
-                
-                botones_data = extract_information_after_click(driver)
-                data.update(botones_data)
-                
-                all_details_data.append(data)
-                
-            except Exception as e:
-                logging.error(f"Error al procesar la URL de detalle {url}: {e}")
-                continue
-    finally:
-        driver.quit()
-
-    if all_details_data:
-        final_df = pd.DataFrame(all_details_data)
-        final_df = final_df.replace(r'[\r\n]+', ' ', regex=True)
-        final_df.to_csv(DETAIL_OUTPUT_FILE, index=False, encoding="utf-8")
-        logging.info(f"FASE 2 COMPLETA: Se guardaron {len(final_df)} registros de detalle en {DETAIL_OUTPUT_FILE}")
-        return True
-    else:
+    # Solo se necesita la columna url: lectura en flujo, únicas en orden y corte al llegar al límite
+    unique_urls: dict[str, None] = {}
+    with URL_LIST_OUTPUT_FILE.open("r", encoding="utf-8", newline="") as handle:
+        for row in csv.DictReader(handle):
+            if len(unique_urls) >= DETAIL_SCRAPE_LIMIT:
+                break
+            if url := row.get("url"):
+                unique_urls[url] = None
+    urls_to_scrape = list(unique_urls)
+    total = len(urls_to_scrape)
+    logging.info(f"Se van a procesar {total} URLs únicas (límite: {DETAIL_SCRAPE_LIMIT}).")
+    if not urls_to_scrape:
         logging.error("FASE 2 FALLIDA: No se extrajo ningún detalle.")
         return False
 
-    return True
+    # La espera es de red/render, no de CPU: varios navegadores avanzan en paralelo.
+    # Bloques contiguos para que concatenar los spools conserve el orden de las URLs.
+    workers = max(1, min(DETAIL_WORKERS, total))
+    chunk_size = -(-total // workers)
+    chunks = [urls_to_scrape[start:start + chunk_size] for start in range(0, total, chunk_size)]
+    spool_files = [TEMP_DIR / DETAIL_SPOOL_TEMPLATE.format(worker_id) for worker_id in range(len(chunks))]
+    logging.info(f"Usando {len(chunks)} navegadores en paralelo.")
+
+    with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+        scraped = sum(pool.map(
+            _scrape_detail_chunk,
+            spool_files,
+            chunks,
+            range(0, total, chunk_size),
+            [total] * len(chunks),
+            [f"{MAIN_PROFILE}-det-{worker_id}" for worker_id in range(len(chunks))],
+            [driver] + [None] * (len(chunks) - 1),
+        ))
+
+    try:
+        if scraped:
+            written = _write_detail_csv(spool_files, DETAIL_OUTPUT_FILE)
+            logging.info(f"FASE 2 COMPLETA: Se guardaron {written} registros de detalle en {DETAIL_OUTPUT_FILE}")
+            return True
+        else:
+            logging.error("FASE 2 FALLIDA: No se extrajo ningún detalle.")
+            return False
+    finally:
+        for spool_file in spool_files:
+            spool_file.unlink(missing_ok=True)
 
 def main():
     """Orquesta las dos fases de la prueba."""
     start_time = time.time()
     
-    # Fase 1
-    if run_main_scraper_phase():
-        # Fase 2
-        run_detail_scraper_phase()
+    # Un solo navegador para ambas fases: arrancar Chrome cuesta varios segundos
+    driver = launch_driver()
+    try:
+        # Fase 1
+        if run_main_scraper_phase(driver):
+            # Fase 2
+            run_detail_scraper_phase(driver)
+    finally:
+        driver.quit()
         
     end_time = time.time()
     logging.info(f"Prueba completada en {end_time - start_time:.2f} segundos.")
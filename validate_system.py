@@ -2,15 +2,14 @@
 """Validador integral del sistema de orquestación."""
 from __future__ import annotations
 
-import importlib.util
+import csv
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List
 
-import pandas as pd
 import yaml
 
-from esdata.configuration import ConfigManager
+from esdata.configuration import ConfigManager, SafeYamlLoader
 from esdata.database import TaskRepository
 from esdata.url_loader import UrlLoader
 
@@ -67,8 +66,7 @@ class SystemValidator:
         config_path = self.base_dir / "config" / "config.yaml"
         if not config_path.exists():
             return False, f"No se encontró {config_path}"
-        with config_path.open("r", encoding="utf-8") as handle:
-            data = yaml.safe_load(handle) or {}
+        data = yaml.load(config_path.read_text(encoding="utf-8"), Loader=SafeYamlLoader) or {}
         required_sections = {"database", "data", "scrapers", "execution", "websites"}
         missing = required_sections - set(data)
         if missing:
@@ -83,8 +81,10 @@ class SystemValidator:
             if not csv_path.exists():
                 issues.append(f"{csv_path} no encontrado")
                 continue
-            df = pd.read_csv(csv_path, encoding="utf-8")
-            if not set(self.loader.REQUIRED_COLUMNS).issubset(df.columns):
+            # Solo importa el encabezado; no se parsea el resto del archivo
+            with csv_path.open("r", encoding="utf-8-sig", newline="") as handle:
+                header = next(csv.reader(handle), [])
+            if not set(self.loader.REQUIRED_COLUMNS).issubset(header):
                 issues.append(f"{csv_path} columnas incompletas")
         return (False, "; ".join(issues)) if issues else (True, "OK")
 
@@ -97,9 +97,11 @@ class SystemValidator:
             if not path.exists():
                 issues.append(f"Falta {scraper_file}")
                 continue
-            spec = importlib.util.spec_from_file_location(path.stem, path)
-            if spec is None or spec.loader is None:
-                issues.append(f"No se puede cargar {scraper_file}")
+            # Compilar valida la sintaxis sin importar el módulo ni ejecutar su código
+            try:
+                compile(path.read_bytes(), str(path), "exec")
+            except (SyntaxError, ValueError) as exc:
+                issues.append(f"No se puede cargar {scraper_file}: {exc}")
         return (False, "; ".join(issues)) if issues else (True, "OK")
 
     def _check_database(self) -> tuple[bool, str]:
@@ -114,7 +116,10 @@ class SystemValidator:
 
 def main() -> None:
     validator = SystemValidator()
-    results = validator.validate()
+    try:
+        results = validator.validate()
+    finally:
+        validator.repo.close()
     print("=" * 60)
     print("VALIDACIÓN DEL SISTEMA")
     print("=" * 60)